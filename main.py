@@ -14,6 +14,8 @@ Sistema optimizado con:
 - ProcessManager para gestión estructurada
 """
 
+import sys
+
 # Imports optimizados con logging mejorado
 from src.utils.import_optimizer import (
     setup_common_environment, ImportStatus, require_selenium
@@ -24,7 +26,7 @@ from src.constants.enums import (
 from src.core.process_manager import ProcessManager
 from src.core.selenium_manager import SeleniumManager
 from src.utils.screenshot_utils import OptimizedScreenshotManager as ScreenshotManager
-from src.core.performance import OptimizedPerformanceTracker as PerformanceTracker
+from src.core.performance import OptimizedPerformanceTracker as PerformanceTracker, SamplingProfiler
 from src.core.optimized_logger import init_optimized_logging
 from src.constants.paths import ORDER_SAMPLE_FILE
 from src.constants.messages import UserMessages
@@ -104,11 +106,15 @@ def main():
     performance_tracker = PerformanceTracker(logger)  
     screenshot_manager = ScreenshotManager(logger)
     
+    # Build de desarrollo: `python main.py --profile` perfila el Prior Notice completo
+    profiler = SamplingProfiler("logs/prior_notice_profile") if "--profile" in sys.argv else None
+    
     # Crear ProcessManager con todas las dependencias
     process_manager = ProcessManager(
         logger=logger,
         performance_tracker=performance_tracker,
-        screenshot_manager=screenshot_manager
+        screenshot_manager=screenshot_manager,
+        profiler=profiler
     )
     
     try:
@@ -64,9 +64,9 @@ class UserResponse(Enum):
             return cls.NO
         return None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessResult:
-    """Resultado de un proceso"""
+    """Resultado de un proceso (inmutable: los resultados fijos se comparten)"""
     success: bool
     step: ProcessStep
     message: str
@@ -3,6 +3,8 @@ Selectores centralizados para elementos web
 Facilita mantenimiento y reutilización de selectores
 """
 
+from selenium.webdriver.common.by import By
+
 class FDASelectors:
     """Selectores específicos para el sistema FDA"""
     
@@ -33,6 +35,7 @@ class FDASelectors:
     
     # Edición de información
     EDIT_BUTTON = "//button[@title='Edit Information']"
+    EDIT_BUTTON_CSS = "button[title='Edit Information']"
     TRACKING_NUMBER_INPUT = "trackingNumber"
     STATE_SELECT = "state"
     PORT_ARRIVAL_DATE_INPUT = "portOfArrivalDate"
@@ -40,6 +43,18 @@ class FDASelectors:
     # Botones Save & Continue
     SAVE_CONTINUE_BUTTON = "//button[contains(text(), 'Save & Continue')]"
     SAVE_CONTINUE_CLASS = "button button-stepper mdc-button mat-mdc-button mat-unthemed mat-mdc-button-base"
+    SAVE_CONTINUE_BY_CLASS = f"//button[@class='{SAVE_CONTINUE_CLASS}']"
+    SAVE_CONTINUE_CSS = "button.button-stepper"
+    # Vista del paso 3: botón del stepper sin el formulario de edición (el paso 2 hace clic en el
+    # mismo tipo de botón y la SPA no cambia document.readyState, así que el botón solo no alcanza)
+    FINAL_SAVE_VIEW_CSS = f"body:not(:has(#{TRACKING_NUMBER_INPUT})) {SAVE_CONTINUE_CSS}"
+
+class FDALocators:
+    """Locators (By, selector) armados una sola vez para pasar directo a find_element/EC"""
+    
+    TRACKING_NUMBER_INPUT = (By.ID, FDASelectors.TRACKING_NUMBER_INPUT)
+    STATE_SELECT = (By.NAME, FDASelectors.STATE_SELECT)
+    PORT_ARRIVAL_DATE_INPUT = (By.ID, FDASelectors.PORT_ARRIVAL_DATE_INPUT)
 
 class ModalSelectors:
     """Selectores para elementos de modales y dialogs"""
@@ -5,13 +5,16 @@ Incluye timeouts adaptativos basados en performance
 """
 
 import time
-from typing import Dict, Optional
+from collections import deque
+from typing import Deque, Dict, Optional
 
 # Timeouts para Selenium WebDriver
 DEFAULT_WAIT = 10
 SHORT_WAIT = 5
 LONG_WAIT = 15
 TABLE_WAIT = 20  # Para cargas de tabla que pueden demorar
+PAGE_LOAD_TIMEOUT = 30  # Máximo para driver.get (páginas FDA colgadas bajo carga)
+SCRIPT_TIMEOUT = 10     # Máximo para execute_async_script
 
 # Timeouts para sleep explícitos (usar con moderación)
 class SleepTimes:
@@ -77,7 +80,8 @@ class AdaptiveTimeouts:
     """
     
     def __init__(self):
-        self._performance_history: Dict[str, list] = {}
+        self._performance_history: Dict[str, Deque[float]] = {}
+        self._history_sums: Dict[str, float] = {}  # Suma corriente de cada historial
         self._base_multiplier = 1.0
         self._slow_threshold = 2.0  # segundos
         self._fast_threshold = 0.5  # segundos
@@ -86,17 +90,19 @@ class AdaptiveTimeouts:
         """
         Registra el tiempo de una operación para ajustar timeouts futuros
         """
-        if operation_name not in self._performance_history:
-            self._performance_history[operation_name] = []
+        history = self._performance_history.get(operation_name)
+        if history is None:
+            # Mantener solo las últimas 10 mediciones (descarta la más vieja en O(1))
+            history = self._performance_history[operation_name] = deque(maxlen=10)
         
-        # Mantener solo las últimas 10 mediciones
-        history = self._performance_history[operation_name]
+        total = self._history_sums.get(operation_name, 0.0) + elapsed_time
+        if len(history) == history.maxlen:
+            total -= history[0]  # La medición más vieja sale del deque
         history.append(elapsed_time)
-        if len(history) > 10:
-            history.pop(0)
+        self._history_sums[operation_name] = total
         
         # Ajustar multiplicador basado en performance promedio
-        avg_time = sum(history) / len(history)
+        avg_time = total / len(history)
         
         if avg_time > self._slow_threshold:
             self._base_multiplier = min(1.5, self._base_multiplier + 0.1)
@@ -110,10 +116,10 @@ class AdaptiveTimeouts:
         adaptive_timeout = int(base_timeout * self._base_multiplier)
         
         # Timeouts específicos por operación si hay historial
-        if operation_name and operation_name in self._performance_history:
-            history = self._performance_history[operation_name]
+        history = self._performance_history.get(operation_name) if operation_name else None
+        if history is not None:
             if len(history) >= 3:
-                avg_time = sum(history[-3:]) / 3  # Promedio de últimas 3
+                avg_time = (history[-1] + history[-2] + history[-3]) / 3  # Promedio de últimas 3
                 operation_multiplier = max(0.5, min(2.0, avg_time / self._fast_threshold))
                 adaptive_timeout = int(base_timeout * operation_multiplier)
         
@@ -121,7 +127,7 @@ class AdaptiveTimeouts:
         return max(2, min(30, adaptive_timeout))
     
     def get_performance_stats(self) -> Dict:
-        """Obtiene estadísticas de performance"""
+        """Obtiene estadísticas de performance (valores numéricos, en segundos)"""
         stats = {
             "base_multiplier": self._base_multiplier,
             "operations_tracked": len(self._performance_history),
@@ -131,8 +137,8 @@ class AdaptiveTimeouts:
         for operation, times in self._performance_history.items():
             if times:
                 stats["recent_operations"][operation] = {
-                    "avg_time": f"{sum(times) / len(times):.2f}s",
-                    "last_time": f"{times[-1]:.2f}s",
+                    "avg_time_s": self._history_sums[operation] / len(times),
+                    "last_time_s": times[-1],
                     "samples": len(times)
                 }
         
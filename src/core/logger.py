@@ -9,7 +9,9 @@ Características:
 - Configuración por ambiente (DEBUG/PRODUCTION)
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
 from datetime import datetime
 from pathlib import Path
@@ -38,14 +40,22 @@ class AutomationLogger:
     Logger central para el sistema de automatización
     """
     
-    def __init__(self, session_id: Optional[str] = None):
+    # Variable de entorno con el nivel de los loggers de módulo (DEBUG, INFO, ...)
+    LEVEL_ENV_VAR = "AUTOMATION_LOG_LEVEL"
+    
+    def __init__(self, session_id: Optional[str] = None, level: Optional[str] = None):
         """
         Inicializa el sistema de logging
         
         Args:
             session_id: ID único para esta sesión de automatización
+            level: Nivel de los loggers de módulo (default: $AUTOMATION_LOG_LEVEL o DEBUG)
         """
         self.session_id = session_id or self._generate_session_id()
+        level_name = (level or os.environ.get(self.LEVEL_ENV_VAR) or "DEBUG").upper()
+        self.level = logging.getLevelName(level_name)
+        if not isinstance(self.level, int):
+            raise ValueError(f"Nivel de log inválido: {level_name}")
         self.start_time = datetime.now()
         self.logs_dir = Path("logs")
         self.screenshots_dir = self.logs_dir / "screenshots"
@@ -144,7 +154,7 @@ class AutomationLogger:
         
         for module, (subdir, filename) in modules.items():
             logger = logging.getLogger(f'automation.{module}')
-            logger.setLevel(logging.DEBUG)
+            logger.setLevel(self.level)
             
             # Handler para archivo específico del módulo en su subcarpeta
             file_handler = logging.FileHandler(
@@ -159,6 +169,14 @@ class AutomationLogger:
             )
             file_handler.setFormatter(formatter)
             
+            # Buffer en memoria: agrupa escrituras a disco, ERROR+ se escribe inmediatamente
+            memory_handler = logging.handlers.MemoryHandler(
+                capacity=512,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            atexit.register(memory_handler.flush)
+            
             # Handler para consola (solo INFO y superior)
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.INFO)
@@ -167,7 +185,7 @@ class AutomationLogger:
             )
             console_handler.setFormatter(console_formatter)
             
-            logger.addHandler(file_handler)
+            logger.addHandler(memory_handler)
             logger.addHandler(console_handler)
             
             self.loggers[module] = logger
@@ -179,7 +197,10 @@ class AutomationLogger:
         self.info(f"Timestamp: {self.start_time}", module='main')
         self.info(f"Logs directory: {self.logs_dir.absolute()}", module='main')
         
-        # Log de configuración del entorno y estructura de directorios
+        # Log de configuración del entorno (solo si DEBUG está habilitado)
+        if not self.main_logger.isEnabledFor(logging.DEBUG):
+            return
+        
         env_info = {
             "python_version": f"{os.sys.version}",
             "working_directory": str(Path.cwd()),
@@ -222,9 +243,9 @@ class AutomationLogger:
         extra.update(kwargs)
         logger.info(message, extra=extra)
         
-        # Agregar a tracking de sesión
+        # Agregar a tracking de sesión (timestamp crudo, se formatea al exportar)
         self.session_events.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'level': 'INFO',
             'module': module,
             'message': message
@@ -258,9 +279,9 @@ class AutomationLogger:
         
         error_logger.error(f"ERROR DETAILS: {json.dumps(error_details, indent=2)}", extra=extra)
         
-        # Agregar a tracking de sesión
+        # Agregar a tracking de sesión (timestamp crudo, se formatea al exportar)
         self.session_events.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'level': 'ERROR',
             'module': module,
             'message': message,
@@ -276,6 +297,18 @@ class AutomationLogger:
         
         # También logear en errors
         self.error(f"CRITICAL: {message}", module=module, exception=exception, **kwargs)
+    
+    def export_session_events(self) -> list:
+        """
+        Exporta los eventos de sesión con timestamps en formato ISO
+        
+        Returns:
+            Lista de eventos con 'timestamp' formateado como ISO 8601
+        """
+        return [
+            {**event, 'timestamp': datetime.fromtimestamp(event['timestamp']).isoformat()}
+            for event in self.session_events
+        ]
 
 # Decorador para logging automático de funciones
 def log_function_call(module: str = 'main', level: str = 'INFO'):
@@ -286,17 +319,20 @@ def log_function_call(module: str = 'main', level: str = 'INFO'):
         module: Módulo donde logear
         level: Nivel de log
     """
+    is_debug = level.upper() == 'DEBUG'
+    
     def decorator(func):
+        # Nombre calculado una sola vez al decorar
+        func_name = f"{getattr(func, '__module__', '')}.{func.__name__}".lstrip('.')
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Obtener instancia del logger (asume que está disponible globalmente)
             logger = getattr(wrapper, '_automation_logger', None)
             
             if logger:
-                func_name = f"{func.__module__}.{func.__name__}" if hasattr(func, '__module__') else func.__name__
-                
                 # Log de inicio
-                if level.upper() == 'DEBUG':
+                if is_debug:
                     logger.debug(f"🔧 Iniciando función: {func_name}", module=module)
                 else:
                     logger.info(f"🔧 Ejecutando: {func_name}", module=module)
@@ -338,18 +374,19 @@ def get_logger() -> AutomationLogger:
 # Método estático para compatibilidad 
 AutomationLogger.get_instance = staticmethod(get_logger)
 
-def init_logging(session_id: Optional[str] = None) -> AutomationLogger:
+def init_logging(session_id: Optional[str] = None, level: Optional[str] = None) -> AutomationLogger:
     """
     Inicializa el sistema de logging para una nueva sesión
     
     Args:
         session_id: ID opcional para la sesión
+        level: Nivel opcional de los loggers (ver AutomationLogger)
         
     Returns:
         Instancia del logger configurado
     """
     global _global_logger
-    _global_logger = AutomationLogger(session_id)
+    _global_logger = AutomationLogger(session_id, level)
     
     # Configurar el decorador para usar este logger
     log_function_call._automation_logger = _global_logger
@@ -14,6 +14,18 @@ from typing import Dict, Set, Optional
 from logging.handlers import RotatingFileHandler
 import threading
 
+# Niveles por nombre, para chequear isEnabledFor antes de tocar el filtro anti-spam
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Args que van tal cual a la clave del filtro: hashables por valor y sin referencias a otros objetos
+_PLAIN_ARG_TYPES = (str, int, float, bool, type(None))
+
 
 class SpamFilter:
     """Filtro inteligente para evitar spam de logs"""
@@ -21,35 +33,38 @@ class SpamFilter:
     def __init__(self, time_window: int = 10, max_duplicates: int = 3):
         self.time_window = time_window  # Ventana de tiempo en segundos
         self.max_duplicates = max_duplicates  # Máximo de mensajes duplicados
-        self.message_cache: Dict[str, list] = {}  # Cache de mensajes recientes
+        self.message_cache: Dict[tuple, list] = {}  # Cache de mensajes recientes
         self.lock = threading.Lock()
     
-    def should_log(self, message: str, level: str) -> bool:
+    def should_log(self, message: str, level: str, args: tuple = ()) -> bool:
         """Determina si un mensaje debe ser loggeado o es spam"""
         current_time = time.time()
-        message_key = f"{level}:{message}"
+        # Args simples van tal cual; el resto (no hashables, excepciones con sus frames) como texto,
+        # para no retenerlos en el cache y que dos fallos iguales compartan clave
+        message_key = (level, message, tuple(
+            arg if isinstance(arg, _PLAIN_ARG_TYPES) else str(arg) for arg in args
+        ))
         
         with self.lock:
             # Limpiar mensajes antiguos
-            if message_key in self.message_cache:
-                self.message_cache[message_key] = [
-                    t for t in self.message_cache[message_key] 
-                    if current_time - t < self.time_window
-                ]
+            timestamps = self.message_cache.get(message_key)
+            if timestamps is None:
+                timestamps = []
             else:
-                self.message_cache[message_key] = []
+                timestamps = [t for t in timestamps if current_time - t < self.time_window]
+            self.message_cache[message_key] = timestamps
             
             # Verificar si excede el límite
-            recent_count = len(self.message_cache[message_key])
+            recent_count = len(timestamps)
             
             if recent_count >= self.max_duplicates:
                 # Solo loggear cada 5 repeticiones adicionales
                 if recent_count % 5 == 0:
-                    self.message_cache[message_key].append(current_time)
+                    timestamps.append(current_time)
                     return True, f"[REPETIDO {recent_count}x] {message}"
                 return False, None
             else:
-                self.message_cache[message_key].append(current_time)
+                timestamps.append(current_time)
                 return True, message
 
 
@@ -191,41 +206,55 @@ class OptimizedLogger:
             except:
                 pass
     
-    def _log_with_filter(self, level: str, message: str, module: str = "main", **kwargs):
-        """Log con filtro anti-spam"""
-        should_log, filtered_message = self.spam_filter.should_log(message, level)
+    def _log_with_filter(self, level: str, message: str, module: str = "main", args: tuple = (), **kwargs):
+        """Log con filtro anti-spam (args se formatean solo si el record se emite)"""
+        if not self.logger.isEnabledFor(_LEVELS[level]):
+            return
+        
+        should_log, filtered_message = self.spam_filter.should_log(message, level, args)
         
         if should_log:
             # Agregar información de módulo extra (evitar conflicto con LogRecord)
             extra = {'source_module': module}
             extra.update(kwargs)
             
-            getattr(self.logger, level.lower())(filtered_message, extra=extra)
+            getattr(self.logger, level.lower())(filtered_message, *args, extra=extra)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Indica si un nivel se emitiría (permite evitar trabajo de formateo)"""
+        return self.logger.isEnabledFor(level)
     
-    def debug(self, message: str, module: str = "main", **kwargs):
+    def debug(self, message: str, *args, module: str = "main", **kwargs):
         """Debug log (deshabilitado por defecto)"""
         if self.logger.level <= logging.DEBUG:
-            self._log_with_filter("DEBUG", message, module, **kwargs)
+            self._log_with_filter("DEBUG", message, module, args, **kwargs)
     
-    def info(self, message: str, module: str = "main", **kwargs):
+    def info(self, message: str, *args, module: str = "main", **kwargs):
         """Info log con filtro anti-spam"""
-        self._log_with_filter("INFO", message, module, **kwargs)
+        self._log_with_filter("INFO", message, module, args, **kwargs)
     
-    def warning(self, message: str, module: str = "main", **kwargs):
+    def warning(self, message: str, *args, module: str = "main", **kwargs):
         """Warning log"""
-        self._log_with_filter("WARNING", message, module, **kwargs)
+        self._log_with_filter("WARNING", message, module, args, **kwargs)
     
-    def error(self, message: str, module: str = "main", exception: Exception = None, **kwargs):
+    def error(self, message: str, *args, module: str = "main", exception: Exception = None, **kwargs):
         """Error log con excepción opcional"""
         if exception:
-            message = f"{message}: {str(exception)}"
-        self._log_with_filter("ERROR", message, module, **kwargs)
+            message, args = self._append_exception(message, args, exception)
+        self._log_with_filter("ERROR", message, module, args, **kwargs)
     
-    def critical(self, message: str, module: str = "main", exception: Exception = None, **kwargs):
+    def critical(self, message: str, *args, module: str = "main", exception: Exception = None, **kwargs):
         """Critical log"""
         if exception:
-            message = f"{message}: {str(exception)}"
-        self._log_with_filter("CRITICAL", message, module, **kwargs)
+            message, args = self._append_exception(message, args, exception)
+        self._log_with_filter("CRITICAL", message, module, args, **kwargs)
+    
+    @staticmethod
+    def _append_exception(message: str, args: tuple, exception: Exception) -> tuple:
+        """Agrega la excepción al mensaje respetando el formateo diferido"""
+        if args:
+            return f"{message}: %s", args + (exception,)
+        return f"{message}: {str(exception)}", args
     
     def step(self, step_name: str, status: str = "start", duration: float = None):
         """Log optimizado para pasos de proceso"""
@@ -3,92 +3,244 @@ Sistema de métricas de performance optimizado - Anti-spam
 Tracking esencial sin verbosidad excesiva
 """
 
+import heapq
+import logging
+import math
+import re
+import sys
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-from contextlib import contextmanager
-from dataclasses import dataclass, field
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from dataclasses import dataclass
+from threading import Lock
 
 try:
-    from .optimized_logger import get_optimized_logger
+    import pyinstrument  # Opcional: profiler por muestreo para builds de desarrollo
 except ImportError:
-    # Fallback para compatibilidad
-    import logging
-    get_optimized_logger = lambda: logging.getLogger("performance")
+    pyinstrument = None
 
 
-@dataclass
+def _get_default_logger():
+    """Logger por defecto, importado solo si no se inyecta uno (evita gzip/handlers al importar)"""
+    try:
+        from .optimized_logger import get_optimized_logger
+    except ImportError:
+        # Fallback para compatibilidad
+        return logging.getLogger("performance")
+    return get_optimized_logger()
+
+
+# Reloj monotónico de alta resolución para medir duraciones
+_now = time.perf_counter
+
+
+def _pct(num: float, den: float) -> float:
+    """Porcentaje redondeado a 1 decimal, 0.0 si el denominador no es positivo"""
+    return round(num / den * 100, 1) if den > 0 else 0.0
+
+
+@dataclass(slots=True)
 class PerformanceMetric:
     """Métrica optimizada de performance"""
     name: str
-    start_time: float
+    start_time: float  # _now(): solo válido para calcular intervalos
     end_time: Optional[float] = None
     duration: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None  # Se crea solo al escribir
     status: str = "running"
     
     def complete(self, metadata: Optional[Dict] = None):
         """Completa métrica sin spam de logs"""
-        self.end_time = time.time()
+        self.end_time = _now()
         self.duration = self.end_time - self.start_time
         self.status = "completed"
         if metadata:
+            if self.metadata is None:
+                self.metadata = {}
             self.metadata.update(metadata)
     
     def fail(self, error: str, metadata: Optional[Dict] = None):
         """Marca métrica como fallida"""
-        self.end_time = time.time()
+        self.end_time = _now()
         self.duration = self.end_time - self.start_time
         self.status = "failed"
+        if self.metadata is None:
+            self.metadata = {}
         self.metadata["error"] = error
         if metadata:
             self.metadata.update(metadata)
 
 
+class _TrackContext:
+    """Context manager de tracking sin generador ni dict por invocación"""
+    __slots__ = ("tracker", "metric")
+    
+    def __init__(self, tracker: "OptimizedPerformanceTracker", operation_name: str, metadata: Optional[Dict]):
+        self.tracker = tracker
+        self.metric = PerformanceMetric(
+            name=sys.intern(operation_name),  # Lookups en _operation_stats por identidad
+            start_time=_now(),
+            metadata=metadata or None
+        )
+    
+    def __enter__(self) -> PerformanceMetric:
+        self.tracker._active_stack.append(self.metric)
+        return self.metric
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        tracker, metric = self.tracker, self.metric
+        try:
+            if exc_type is None:
+                metric.complete()
+                # Log inteligente - solo si es relevante
+                tracker._smart_log(metric)
+            elif issubclass(exc_type, Exception):
+                metric.fail(str(exc_val))
+                # Errores siempre se loggean
+                tracker.logger.error("%s falló: %s", metric.name, exc_val, module="perf")
+        finally:
+            tracker._finish_metric(metric)
+        return False
+
+
 class OptimizedPerformanceTracker:
     """Tracker de performance sin spam - Solo métricas esenciales"""
     
-    def __init__(self, logger=None, session_id: str = None):
-        self.logger = logger or get_optimized_logger()
-        self.session_id = session_id or f"perf_{datetime.now().strftime('%H%M%S')}"
-        self.metrics: List[PerformanceMetric] = []
-        self.active_metrics: Dict[str, PerformanceMetric] = {}
-        self.session_start = time.time()
+    def __init__(self, logger=None, session_id: str = None, history_cap: int = 10000):
+        self.logger = logger or _get_default_logger()
+        self.session_id = session_id or f"perf_{int(time.time()) & 0xFFFFFF:06x}"
+        # Historial acotado: las métricas más viejas se descartan, los agregados las conservan.
+        # Es un deque (no list): admite índices e iteración, pero no slices (usar islice o list())
+        self.history_cap = history_cap
+        self.metrics: Deque[PerformanceMetric] = deque(maxlen=history_cap)
+        self._history_wrapped = False  # Para avisar una sola vez cuando se empiezan a descartar
+        self._active_stack: List[PerformanceMetric] = []
+        self.session_start = time.time()  # Reloj de pared, solo informativo
+        self._session_mono = _now()  # Base para los intervalos
         
         # Configuración anti-spam
         self.log_threshold = 2.0  # Solo loggear operaciones >2s
         self.critical_operations = {'selenium', 'fda', 'step', 'process', 'screenshot'}
+        self._critical_search = re.compile(
+            '|'.join(map(re.escape, sorted(self.critical_operations))), re.IGNORECASE
+        ).search
+        
+        # Agregados incrementales por operación (O(1) por métrica)
+        self._operation_stats: Dict[str, Dict[str, Any]] = {}
+        
+        # Agregados de sesión mantenidos al cerrar cada métrica
+        self._completed_count = 0
+        self._failed_count = 0
+        self._slow_count = 0
+        self._total_duration = 0.0
+        
+        # Buffer de logs: se vuelca al llenarse o al cerrar la sesión
+        self._log_buffer: List[tuple] = []
+        self._log_buffer_size = 64
         
         # Log inicial silencioso
         self.logger.info("Tracker iniciado", module="perf")
     
-    @contextmanager
-    def track(self, operation_name: str, metadata: Optional[Dict] = None):
+    def track(self, operation_name: str, metadata: Optional[Dict] = None) -> "_TrackContext":
         """Context manager silencioso para tracking"""
+        return _TrackContext(self, operation_name, metadata)
+    
+    def record(self, operation_name: str, start_time: float, error: Optional[str] = None):
+        """
+        Registra una operación ya terminada que empezó en start_time (valor de _now())
+        
+        Camino rápido sin context manager ni pila de activas (ver call_tracked()).
+        """
+        end_time = _now()
         metric = PerformanceMetric(
-            name=operation_name,
-            start_time=time.time(),
-            metadata=metadata or {}
+            name=sys.intern(operation_name),
+            start_time=start_time,
+            end_time=end_time,
+            duration=end_time - start_time,
+            status="completed" if error is None else "failed"
         )
+        if error is None:
+            self._smart_log(metric)
+        else:
+            metric.metadata = {"error": error}
+            self.logger.error("%s falló: %s", metric.name, error, module="perf")
+        self._append_metric(metric)
+        self._update_operation_stats(metric)
+    
+    def _append_metric(self, metric: PerformanceMetric):
+        """Agrega al historial; la primera vez que está lleno avisa que se descartan las más viejas"""
+        if not self._history_wrapped and len(self.metrics) == self.metrics.maxlen:
+            self._history_wrapped = True
+            self.logger.warning(
+                "Historial de métricas lleno (%s): se descartan las más antiguas", self.history_cap, module="perf"
+            )
+        self.metrics.append(metric)
+    
+    def _finish_metric(self, metric: PerformanceMetric):
+        """Registra la métrica terminada y la saca de la pila de activas"""
+        self._append_metric(metric)
+        self._update_operation_stats(metric)
+        # Los contextos se anidan en orden LIFO; el scan solo cubre usos fuera de orden
+        if self._active_stack[-1] is metric:
+            self._active_stack.pop()
+        else:
+            self._active_stack.remove(metric)
+    
+    def _update_operation_stats(self, metric: PerformanceMetric):
+        """Actualiza los agregados de sesión y de la operación en tiempo constante"""
+        if metric.status == "running":
+            return  # Interrumpida (KeyboardInterrupt, etc.): sin duración útil
         
-        self.active_metrics[operation_name] = metric
+        stats = self._operation_stats.get(metric.name)
+        if stats is None:
+            stats = self._operation_stats[metric.name] = {
+                "count": 0, "failures": 0, "total": 0.0, "mean": 0.0, "m2": 0.0,
+                "min": math.inf, "max": 0.0, "last": 0.0,
+                "trend": deque(maxlen=5)
+            }
         
-        try:
-            yield metric
-            metric.complete()
-            
-            # Log inteligente - solo si es relevante
-            self._smart_log(metric)
-            
-        except Exception as e:
-            metric.fail(str(e))
-            # Errores siempre se loggean
-            self.logger.error(f"{operation_name} falló: {e}", module="perf")
-            raise
-        finally:
-            self.metrics.append(metric)
-            if operation_name in self.active_metrics:
-                del self.active_metrics[operation_name]
+        if metric.status == "failed":
+            self._failed_count += 1
+            stats["failures"] += 1
+            return
+        
+        duration = metric.duration
+        self._completed_count += 1
+        self._total_duration += duration
+        if duration > 1.0:  # Solo operaciones lentas para el resumen
+            self._slow_count += 1
+        
+        # Welford: media y suma de cuadrados de desvíos estables (sin restar cuadrados grandes)
+        count = stats["count"] = stats["count"] + 1
+        stats["total"] += duration
+        delta = duration - stats["mean"]
+        stats["mean"] += delta / count
+        stats["m2"] += delta * (duration - stats["mean"])
+        stats["last"] = duration
+        stats["trend"].append(duration)
+        if duration < stats["min"]:
+            stats["min"] = duration
+        if duration > stats["max"]:
+            stats["max"] = duration
+    
+    def get_step_statistics(self, operation_name: str) -> Dict:
+        """Estadísticas de una operación leídas de los agregados incrementales"""
+        stats = self._operation_stats.get(operation_name)
+        if not stats or not stats["count"]:
+            return {"status": "no_data"}
+        
+        count = stats["count"]
+        
+        return {
+            "count": count,
+            "failures": stats["failures"],
+            "avg": stats["mean"],
+            "min": stats["min"],
+            "max": stats["max"],
+            "last": stats["last"],
+            "stddev": math.sqrt(stats["m2"] / count),
+            "recent_trend": list(stats["trend"])
+        }
     
     def _smart_log(self, metric: PerformanceMetric):
         """Logging inteligente - reduce spam significativamente"""
@@ -97,53 +249,96 @@ class OptimizedPerformanceTracker:
         # 2. Cualquier operación que dure >2s
         # 3. Operaciones que fallan
         
-        is_critical = any(keyword in metric.name.lower() 
-                         for keyword in self.critical_operations)
-        
         if metric.status == "failed":
-            self.logger.error(f"❌ {metric.name}: {metric.duration:.1f}s", module="perf")
-        elif (is_critical and metric.duration > 1.0) or metric.duration > self.log_threshold:
-            if metric.duration > 10.0:
-                self.logger.warning(f"🐌 {metric.name}: {metric.duration:.1f}s", module="perf")
-            else:
-                self.logger.info(f"⏱️ {metric.name}: {metric.duration:.1f}s", module="perf")
+            self.logger.error("❌ %s: %.1fs", metric.name, metric.duration, module="perf")
+            return
+        
+        # Comparaciones numéricas primero: la búsqueda por nombre solo si hace falta
+        duration = metric.duration
+        if not (duration > self.log_threshold or
+                (duration > 1.0 and self._critical_search(metric.name) is not None)):
+            return
+        
+        if duration > 10.0:
+            if self._logger_enabled(logging.WARNING):
+                self._buffer_log("warning", "🐌 %s: %.1fs", metric.name, duration)
+        elif self._logger_enabled(logging.INFO):
+            self._buffer_log("info", "⏱️ %s: %.1fs", metric.name, duration)
+    
+    def _buffer_log(self, level: str, message: str, *args):
+        """Acumula un log y lo vuelca cuando el buffer se llena"""
+        self._log_buffer.append((level, message, args))
+        if len(self._log_buffer) >= self._log_buffer_size:
+            self._flush_logs()
+    
+    def _flush_logs(self):
+        """Vuelca los logs acumulados al logger"""
+        if not self._log_buffer:
+            return
+        buffered, self._log_buffer = self._log_buffer, []
+        for level, message, args in buffered:
+            getattr(self.logger, level)(message, *args, module="perf")
+    
+    @property
+    def active_metrics(self) -> List[PerformanceMetric]:
+        """Métricas en curso, de la más externa a la más interna"""
+        return list(self._active_stack)
     
     def track_step(self, step_name: str, metadata: Optional[Dict] = None):
         """Tracking específico para pasos (siempre relevante)"""
         return self.track(f"step_{step_name}", metadata)
     
+    def _logger_enabled(self, level: int) -> bool:
+        """True si el logger emitiría el nivel (loggers sin isEnabledFor siempre emiten)"""
+        is_enabled = getattr(self.logger, "isEnabledFor", None)
+        return is_enabled is None or is_enabled(level)
+    
     def log_milestone(self, milestone_name: str, details: str = None):
         """Milestone importante - siempre se loggea"""
-        elapsed = time.time() - self.session_start
-        detail_str = f" - {details}" if details else ""
-        self.logger.info(f"🎯 {milestone_name} ({elapsed:.1f}s){detail_str}", module="milestone")
+        if not self._logger_enabled(logging.INFO):
+            return
+        
+        elapsed = _now() - self._session_mono
+        if details:
+            self.logger.info("🎯 %s (%.1fs) - %s", milestone_name, elapsed, details, module="milestone")
+        else:
+            self.logger.info("🎯 %s (%.1fs)", milestone_name, elapsed, module="milestone")
     
     def get_performance_summary(self) -> Dict:
-        """Resumen compacto de performance"""
-        completed = [m for m in self.metrics if m.status == "completed"]
-        failed = [m for m in self.metrics if m.status == "failed"]
-        
-        if not completed and not failed:
+        """Resumen compacto de performance (lectura directa de los agregados)"""
+        failed_count = self._failed_count
+        total_ops = self._completed_count + failed_count
+        if not total_ops:
             return {"status": "no_data"}
         
-        total_ops = len(completed) + len(failed)
-        total_time = sum(m.duration for m in completed if m.duration)
-        session_time = time.time() - self.session_start
+        total_time = self._total_duration
+        session_time = _now() - self._session_mono
         
-        # Solo operaciones lentas para el resumen
-        slow_ops = [m for m in completed if m.duration and m.duration > 1.0]
+        # Top 3 por duración promedio sin ordenar todas las operaciones
+        slowest = heapq.nlargest(
+            3,
+            ((stats["total"] / stats["count"], name)
+             for name, stats in self._operation_stats.items() if stats["count"]),
+        )
         
         return {
             "session_duration": round(session_time, 1),
             "total_operations": total_ops,
-            "slow_operations": len(slow_ops),
-            "failed_operations": len(failed),
+            "slow_operations": self._slow_count,
+            "failed_operations": failed_count,
             "total_processing_time": round(total_time, 1),
-            "efficiency": round((total_time / session_time * 100), 1) if session_time > 0 else 0
+            "efficiency": _pct(total_time, session_time),
+            "slowest_operations": [(name, round(avg, 2)) for avg, name in slowest]
         }
     
     def log_session_summary(self):
         """Resumen final compacto"""
+        self._flush_logs()
+        
+        # Sin INFO habilitado no vale la pena construir el resumen
+        if not self._logger_enabled(logging.INFO):
+            return
+        
         try:
             summary = self.get_performance_summary()
             
@@ -156,32 +351,36 @@ class OptimizedPerformanceTracker:
                 summary["failed_operations"] > 0):
                 
                 self.logger.info(
-                    f"Sesión: {summary['session_duration']}s, "
-                    f"{summary['slow_operations']} ops lentas, "
-                    f"{summary['failed_operations']} fallos",
+                    "Sesión: %ss, %s ops lentas, %s fallos",
+                    summary['session_duration'],
+                    summary['slow_operations'],
+                    summary['failed_operations'],
                     module="summary"
                 )
                 
                 if summary["efficiency"] < 50 and summary["session_duration"] > 60:
-                    self.logger.warning(f"Eficiencia baja: {summary['efficiency']}%", module="summary")
+                    self.logger.warning("Eficiencia baja: %s%%", summary['efficiency'], module="summary")
             
         except Exception:
             pass  # Silenciar errores de resumen
     
     def get_critical_metrics(self) -> List[Dict]:
         """Solo métricas críticas para debugging"""
-        critical_metrics = []
-        
-        for metric in self.metrics:
-            if (metric.duration and metric.duration > 5.0) or metric.status == "failed":
-                critical_metrics.append({
-                    "name": metric.name,
-                    "duration": metric.duration,
-                    "status": metric.status,
-                    "metadata": metric.metadata
-                })
+        # Filtrar primero y construir dicts solo para el subconjunto crítico
+        critical = [
+            metric for metric in self.metrics
+            if (metric.duration or 0.0) > 5.0 or metric.status == "failed"
+        ]
         
-        return critical_metrics
+        return [
+            {
+                "name": metric.name,
+                "duration": metric.duration,
+                "status": metric.status,
+                "metadata": metric.metadata or {}
+            }
+            for metric in critical
+        ]
     
     def __enter__(self):
         return self
@@ -190,17 +389,85 @@ class OptimizedPerformanceTracker:
         self.log_session_summary()
 
 
-def create_performance_tracker(logger=None, session_id: str = None) -> OptimizedPerformanceTracker:
+def create_performance_tracker(logger=None, session_id: str = None, history_cap: int = 10000) -> OptimizedPerformanceTracker:
     """Factory function para crear tracker optimizado"""
-    return OptimizedPerformanceTracker(logger, session_id)
+    return OptimizedPerformanceTracker(logger, session_id, history_cap)
 
 
 # Singleton para uso global
 _global_tracker = None
+_global_tracker_lock = Lock()
 
 def get_global_performance_tracker() -> OptimizedPerformanceTracker:
-    """Obtiene instancia global del tracker"""
+    """Obtiene instancia global del tracker (el lock solo se toma al crearlo)"""
     global _global_tracker
     if _global_tracker is None:
-        _global_tracker = OptimizedPerformanceTracker()
-    return _global_tracker 
\ No newline at end of file
+        with _global_tracker_lock:
+            if _global_tracker is None:
+                _global_tracker = OptimizedPerformanceTracker()
+    return _global_tracker
+
+
+def call_tracked(tracker: Optional[OptimizedPerformanceTracker], operation_name: str, func, *args, **kwargs):
+    """
+    Llama a func midiendo con _now() y registra con tracker.record() (sin context manager)
+    
+    Sin tracker usa el global vigente; sin ninguno llama a la función directamente.
+    """
+    if tracker is None:
+        tracker = _global_tracker
+        if tracker is None:
+            return func(*args, **kwargs)
+    start_time = _now()
+    try:
+        result = func(*args, **kwargs)
+    except Exception as e:
+        tracker.record(operation_name, start_time, str(e))
+        raise
+    tracker.record(operation_name, start_time)
+    return result
+
+
+class SamplingProfiler:
+    """
+    Profiler de desarrollo para una ejecución completa (alternativa a track() por paso)
+    
+    Usa pyinstrument (muestreo, bajo overhead) si está instalado; si no, cProfile de la stdlib.
+    Al salir imprime el reporte y, si se indica output_path (sin extensión), lo guarda en disco
+    como .html (pyinstrument) o .prof (cProfile, legible con pstats/snakeviz).
+    """
+    
+    def __init__(self, output_path: Optional[str] = None, top: int = 25):
+        self.output_path = output_path
+        self.top = top
+        self._profiler = None
+    
+    @property
+    def backend(self) -> str:
+        return "pyinstrument" if pyinstrument is not None else "cProfile"
+    
+    def __enter__(self):
+        if pyinstrument is not None:
+            self._profiler = pyinstrument.Profiler()
+            self._profiler.start()
+        else:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        profiler, self._profiler = self._profiler, None
+        if pyinstrument is not None:
+            profiler.stop()
+            print(profiler.output_text(unicode=True, color=False))
+            if self.output_path:
+                with open(f"{self.output_path}.html", "w", encoding="utf-8") as f:
+                    f.write(profiler.output_html())
+        else:
+            import pstats
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+            if self.output_path:
+                profiler.dump_stats(f"{self.output_path}.prof")
+        return False
@@ -4,10 +4,14 @@ Refactoriza funciones largas en componentes pequeños y reutilizables
 """
 
 import time
-from datetime import datetime
-from typing import Optional, Tuple
+from contextlib import nullcontext
+from importlib import import_module
+from typing import Dict, Optional, Tuple
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
 from ..constants.enums import (
     ProcessStep, ProcessResult, SystemConfiguration, 
@@ -15,72 +19,244 @@ from ..constants.enums import (
 )
 from ..constants.timeouts import SleepTimes, ElementTimeouts
 from ..constants.messages import ProcessMessages, LogMessages, UserMessages
-from ..fda.prior_notice.creation.step_01_selection import execute_step_01
-from ..fda.prior_notice.creation.step_02_edit_information import execute_step_02
-from ..fda.prior_notice.creation.step_03_final_save import execute_step_03
-from ..fda.authentication.fda_login import complete_fda_login
+from ..constants.selectors import FDASelectors
+from .performance import call_tracked
 from ..utils.selenium_helpers import WaitHelper
 
+# Valores de módulo resueltos una vez (evita el acceso al enum en cada log)
+_MAIN_MODULE = SystemModule.MAIN.value
+_FDA_MODULE = SystemModule.FDA.value
+_SELENIUM_MODULE = SystemModule.SELENIUM.value
+
+# Locators de la navegación al Prior Notice System, construidos una sola vez
+# (CSS cuando alcanza con atributos: el navegador lo resuelve más rápido que XPath)
+_PRIOR_NOTICE_LINK = (By.CSS_SELECTOR, "a[title='Prior Notice System Interface']")
+_SUBMISSIONS_BUTTON = (By.CSS_SELECTOR, "button[routerlink='/submissions']")
+# Primera fila + su botón Copy en un único XPath (una ida y vuelta al navegador en vez de tres);
+# queda en XPath porque CSS no puede anclar "[1]" a la primera fila del documento
+_FIRST_ROW_COPY_BUTTON = (
+    By.XPATH, f"({FDASelectors.TABLE_ROWS})[1]{FDASelectors.COPY_BUTTON.lstrip('.')}"
+)
+
+
+def _load_step_function(module_name: str, function_name: str):
+    """Importa una función de paso bajo demanda (luego es un lookup en sys.modules)"""
+    return getattr(import_module(module_name, __package__), function_name)
+
+
+# Página lista para el siguiente paso: cargada, sin spinner (CommonSelectors.LOADING_SPINNER)
+# y, si se indica, con el selector CSS del siguiente paso presente; una sola ida al browser
+_PAGE_SETTLED_JS = (
+    "return document.readyState === 'complete'"
+    " && !document.querySelector(\"div[class*='loading']\")"
+    " && (!arguments[0] || document.querySelector(arguments[0]) !== null);"
+)
+
+
+def _page_is_settled(ready_selector: Optional[str] = None):
+    """Condición de espera para WebDriverWait: ver _PAGE_SETTLED_JS"""
+    def condition(driver: WebDriver) -> bool:
+        return driver.execute_script(_PAGE_SETTLED_JS, ready_selector)
+    return condition
+
+
+# Bloques de texto fijos para consola: se arman una vez y se imprimen con una sola escritura
+_SUCCESS_SUMMARY_TEXT = "\n".join([
+    f"\n🎉 {LogMessages.PROCESS_COMPLETED.format(process='CREACIÓN DE PRIOR NOTICE')}",
+    ProcessMessages.SUCCESS_SUMMARY,
+    "📊 Resumen de lo ejecutado:",
+    "   ✅ Navegación: Prior notice seleccionado de la tabla",
+    "   ✅ Paso 1: Copy Selection completado",
+    "   ✅ Paso 2: Edit Information completado",
+    "   ✅ Paso 3: Final Save completado",
+    "\n🔗 El Prior Notice debería estar listo en FDA"
+])
+
+_FINAL_SUCCESS_TEXT = "\n".join([
+    f"\n🎯 {ProcessMessages.FINAL_SUCCESS}",
+    "📸 Se pueden tomar screenshots finales...",
+    "📁 Archivos generados en:",
+    "   • Data: data/",
+    "   • Outputs: src/orders/output/",
+    "   • Logs: logs/",
+    "   • Screenshots: logs/screenshots/"
+])
+
+_FINAL_FAILURE_TEMPLATE = "\n".join([
+    "\n❌ El proceso de {operation_type} no se completó exitosamente",
+    "🔍 Revisa los mensajes anteriores para identificar problemas",
+    "📄 Logs detallados disponibles en: logs/",
+    "📸 Screenshots de errores disponibles en: logs/screenshots/"
+])
+
+_FINAL_TIPS_TEXT = "\n".join([
+    "\n💡 Tips para próxima ejecución:",
+    "   • Asegúrate de tener order.csv actualizado",
+    "   • Verifica que FDA no haya cambiado su interfaz",
+    "   • Revisa logs/ para análisis detallado",
+    "   • Screenshots en logs/screenshots/ para debugging visual"
+])
+
+_FINAL_SUCCESS_WITH_TIPS_TEXT = f"{_FINAL_SUCCESS_TEXT}\n{_FINAL_TIPS_TEXT}"
+_FINAL_FAILURE_WITH_TIPS_TEMPLATE = f"{_FINAL_FAILURE_TEMPLATE}\n{_FINAL_TIPS_TEXT}"
+
+_PRIOR_NOTICE_INTRO_TEXT = (
+    f"\n{ProcessMessages.STEP_INDICATOR.format(step='PRIOR_NOTICE', description='Automatización Prior Notice')}\n"
+    "💡 El proceso es mayormente automático\n"
+    "👤 Solo necesitarás ingresar la fecha cuando se solicite"
+)
+
+
+class _NullScreenshotManager:
+    """Screenshot manager nulo: nunca captura (evita chequear None en cada llamada)"""
+    capture_mode = "off"
+    
+    def should_capture(self, kind: str) -> bool:
+        return False
+
+
+_NULL_SCREENSHOT_MANAGER = _NullScreenshotManager()
+
 
 class ProcessManager:
     """Gestor centralizado de procesos de automatización"""
     
-    def __init__(self, logger, performance_tracker=None, screenshot_manager=None):
+    _STEP_DESCRIPTIONS = {
+        ProcessStep.STEP_01_SELECTION: "Copy Selection",
+        ProcessStep.STEP_02_EDIT_INFO: "Edit Information",
+        ProcessStep.STEP_03_FINAL_SAVE: "Final Save"
+    }
+    
+    # Encabezados "📋 PASO ..." formateados una sola vez por paso
+    _STEP_INDICATORS = {
+        step: ProcessMessages.STEP_INDICATOR.format(step=step.value, description=description)
+        for step, description in {
+            ProcessStep.LOGIN: "Autenticación FDA",
+            ProcessStep.NAVIGATION: "Prior Notice System Interface",
+            **_STEP_DESCRIPTIONS,
+        }.items()
+    }
+    
+    ERROR_SCREENSHOT_INTERVAL = 2.0  # Segundos mínimos entre screenshots de error con el mismo nombre
+    
+    # Resultados de éxito sin datos dinámicos: se crean una vez y se comparten (ProcessResult es inmutable)
+    _SUCCESS_RESULTS = {
+        step: ProcessResult(success=True, step=step, message=message)
+        for step, message in {
+            ProcessStep.LOGIN: "Login exitoso",
+            ProcessStep.NAVIGATION: "Navegación y selección de prior notice exitosa",
+            ProcessStep.COMPLETED: "Prior Notice creado exitosamente",
+            **{step: f"{description} completado" for step, description in _STEP_DESCRIPTIONS.items()},
+        }.items()
+    }
+    
+    # Pasos del Prior Notice en orden: (paso, (módulo, función), args, kwargs)
+    # Los módulos de pasos se importan recién al ejecutarlos (ver _load_step_function);
+    # ready_selector es el elemento (CSS) con el que arranca el paso siguiente
+    _PRIOR_NOTICE_STEPS = (
+        (ProcessStep.STEP_01_SELECTION, ("..fda.prior_notice.creation.step_01_selection", "execute_step_01"),
+         (SleepTimes.SHORT_WAIT,), {"ready_selector": FDASelectors.EDIT_BUTTON_CSS}),
+        (ProcessStep.STEP_02_EDIT_INFO, ("..fda.prior_notice.creation.step_02_edit_information", "execute_step_02"),
+         (), {"wait": SleepTimes.SHORT_WAIT, "ready_selector": FDASelectors.FINAL_SAVE_VIEW_CSS}),
+        (ProcessStep.STEP_03_FINAL_SAVE, ("..fda.prior_notice.creation.step_03_final_save", "execute_step_03"),
+         (), {"wait": SleepTimes.SHORT_WAIT}),
+    )
+    
+    def __init__(self, logger, performance_tracker=None, screenshot_manager=None, profiler=None,
+                 batch_mode: bool = False):
         self.logger = logger
         self.performance_tracker = performance_tracker
-        self.screenshot_manager = screenshot_manager
+        self.screenshot_manager = screenshot_manager or _NULL_SCREENSHOT_MANAGER
+        self.profiler = profiler  # SamplingProfiler de desarrollo: reemplaza el tracking por paso
+        self.batch_mode = batch_mode  # Sin prints descriptivos por paso (solo logs y resultados)
+        
+        # Último screenshot de error por nombre (time.monotonic), para limitar ráfagas
+        self._error_screenshot_last: Dict[str, float] = {}
+        
+        # WebDriverWait reutilizables para el driver actual, por (timeout, poll_frequency)
+        self._wait_driver: Optional[WebDriver] = None
+        self._waits: Dict[Tuple[float, float], WebDriverWait] = {}
         
+    def _print(self, text: str):
+        """Salida descriptiva de consola por paso (se omite en batch_mode)"""
+        if not self.batch_mode:
+            print(text)
+    
+    def _run_tracked(self, operation_name: str, func, *args, **kwargs):
+        """Ejecuta func con tracking (tracker propio o global; sin tracking si no hay ninguno o si hay profiler)"""
+        if self.profiler is not None:
+            return func(*args, **kwargs)
+        return call_tracked(self.performance_tracker, operation_name, func, *args, **kwargs)
+    
+    def _wait(self, driver: WebDriver, timeout: float, poll_frequency: float = 0.5) -> WebDriverWait:
+        """WebDriverWait cacheado; se descartan todos si cambia el driver"""
+        if driver is not self._wait_driver:
+            self._wait_driver = driver
+            self._waits.clear()
+        
+        key = (timeout, poll_frequency)
+        wait = self._waits.get(key)
+        if wait is None:
+            wait = self._waits[key] = WebDriverWait(driver, timeout, poll_frequency=poll_frequency)
+        return wait
+    
+    def _screenshot(self, kind: str, driver: WebDriver, name: str, *args):
+        """Captura un screenshot ('step', 'success' o 'error') si el modo de captura lo permite"""
+        if not self.screenshot_manager.should_capture(kind):
+            return
+        if kind == "error":
+            # Máximo un screenshot de error por nombre cada ERROR_SCREENSHOT_INTERVAL segundos
+            now = time.monotonic()
+            last = self._error_screenshot_last.get(name)
+            if last is not None and now - last < self.ERROR_SCREENSHOT_INTERVAL:
+                return
+            self._error_screenshot_last[name] = now
+        getattr(self.screenshot_manager, f"capture_{kind}_screenshot")(driver, name, *args)
+    
     def initialize_session(self, operation_type: str) -> SystemConfiguration:
         """Inicializa una nueva sesión del sistema"""
-        session_id = f"{operation_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        session_id = f"{operation_type}_{time.strftime('%Y%m%d_%H%M%S')}"
         
         config = SystemConfiguration(
             session_id=session_id,
             operation_type=operation_type,
             debug_mode=False,
-            screenshot_enabled=self.screenshot_manager is not None,
+            screenshot_enabled=self.screenshot_manager.capture_mode != "off",
             performance_tracking=self.performance_tracker is not None
         )
         
-        self.logger.info(f"🏗️ Nueva sesión iniciada: {session_id}", module=SystemModule.MAIN.value)
+        self.logger.info("🏗️ Nueva sesión iniciada: %s", session_id, module=_MAIN_MODULE)
         return config
         
     def get_user_confirmation(self, message: str) -> bool:
         """Obtiene confirmación del usuario con validación mejorada"""
-        user_input = input(f"\n{message}").strip()
-        response = UserResponse.from_string(user_input)
-        
-        if response == UserResponse.YES:
-            self.logger.info("✅ Usuario confirmó la acción", module=SystemModule.MAIN.value)
-            return True
-        elif response == UserResponse.NO:
-            self.logger.info("❌ Usuario canceló la acción", module=SystemModule.MAIN.value)
-            return False
-        else:
+        prompt = f"\n{message}"
+        while True:
+            response = UserResponse.from_string(input(prompt).strip())
+            
+            if response == UserResponse.YES:
+                self.logger.info("✅ Usuario confirmó la acción", module=_MAIN_MODULE)
+                return True
+            elif response == UserResponse.NO:
+                self.logger.info("❌ Usuario canceló la acción", module=_MAIN_MODULE)
+                return False
+            
             print("⚠️ Respuesta no válida. Por favor responde 's' o 'n'")
-            return self.get_user_confirmation(message)
     
     def execute_navigation(self, driver: WebDriver, url: str) -> ProcessResult:
         """Ejecuta navegación con tracking y manejo de errores"""
         try:
-            self.logger.info(f"🔗 Navegando a: {url}", module=SystemModule.SELENIUM.value)
+            self.logger.info("🔗 Navegando a: %s", url, module=_SELENIUM_MODULE)
             
-            if self.performance_tracker:
-                with self.performance_tracker.track("navigation"):
-                    driver.get(url)
-            else:
-                driver.get(url)
+            self._run_tracked("navigation", driver.get, url)
             
             # Screenshot de navegación
-            if self.screenshot_manager:
-                self.screenshot_manager.capture_step_screenshot(driver, "navigation")
+            self._screenshot("step", driver, "navigation")
             
             # Esperar carga
-            if self.performance_tracker:
-                with self.performance_tracker.track("page_load_wait"):
-                    WaitHelper.wait_for_page_load(driver, ElementTimeouts.PAGE_LOAD)
-            else:
-                WaitHelper.wait_for_page_load(driver, ElementTimeouts.PAGE_LOAD)
+            self._run_tracked(
+                "page_load_wait", WaitHelper.wait_for_page_load, driver, ElementTimeouts.PAGE_LOAD, dom_ready=True
+            )
             
             return ProcessResult(
                 success=True,
@@ -90,10 +266,9 @@ class ProcessManager:
             
         except Exception as e:
             error_msg = f"Error en navegación a {url}: {e}"
-            self.logger.error(error_msg, module=SystemModule.SELENIUM.value, exception=e)
+            self.logger.error(error_msg, module=_SELENIUM_MODULE, exception=e)
             
-            if self.screenshot_manager:
-                self.screenshot_manager.capture_error_screenshot(driver, "navigation_error", e)
+            self._screenshot("error", driver, "navigation_error", e)
             
             return ProcessResult(
                 success=False,
@@ -105,30 +280,23 @@ class ProcessManager:
     def execute_login_process(self, driver: WebDriver) -> ProcessResult:
         """Ejecuta proceso de login con manejo mejorado"""
         try:
-            self.logger.info("🔐 Iniciando proceso de login", module=SystemModule.FDA.value)
-            print(f"\n{ProcessMessages.STEP_INDICATOR.format(step='LOGIN', description='Autenticación FDA')}")
+            self.logger.info("🔐 Iniciando proceso de login", module=_FDA_MODULE)
+            self._print(f"\n{self._STEP_INDICATORS[ProcessStep.LOGIN]}")
             
-            if self.performance_tracker:
-                with self.performance_tracker.track("fda_login_process"):
-                    login_success = complete_fda_login(driver, WebDriverWait(driver, ElementTimeouts.DEFAULT))
-            else:
-                login_success = complete_fda_login(driver, WebDriverWait(driver, ElementTimeouts.DEFAULT))
+            complete_fda_login = _load_step_function("..fda.authentication.fda_login", "complete_fda_login")
+            login_success = self._run_tracked(
+                "fda_login_process", complete_fda_login, driver, self._wait(driver, ElementTimeouts.DEFAULT)
+            )
             
             if login_success:
-                self.logger.info("✅ Login completado exitosamente", module=SystemModule.FDA.value)
-                if self.screenshot_manager:
-                    self.screenshot_manager.capture_success_screenshot(driver, "fda_login_success")
+                self.logger.info("✅ Login completado exitosamente", module=_FDA_MODULE)
+                self._screenshot("success", driver, "fda_login_success")
                 
-                return ProcessResult(
-                    success=True,
-                    step=ProcessStep.LOGIN,
-                    message="Login exitoso"
-                )
+                return self._SUCCESS_RESULTS[ProcessStep.LOGIN]
             else:
                 error_msg = "Error en el proceso de login"
-                self.logger.error(error_msg, module=SystemModule.FDA.value)
-                if self.screenshot_manager:
-                    self.screenshot_manager.capture_error_screenshot(driver, "fda_login_failed")
+                self.logger.error(error_msg, module=_FDA_MODULE)
+                self._screenshot("error", driver, "fda_login_failed")
                 
                 return ProcessResult(
                     success=False,
@@ -139,10 +307,9 @@ class ProcessManager:
                 
         except Exception as e:
             error_msg = f"Error inesperado en login: {e}"
-            self.logger.error(error_msg, module=SystemModule.FDA.value, exception=e)
+            self.logger.error(error_msg, module=_FDA_MODULE, exception=e)
             
-            if self.screenshot_manager:
-                self.screenshot_manager.capture_error_screenshot(driver, "login_exception", e)
+            self._screenshot("error", driver, "login_exception", e)
             
             return ProcessResult(
                 success=False,
@@ -152,49 +319,43 @@ class ProcessManager:
             )
     
     def execute_step_with_tracking(self, driver: WebDriver, step: ProcessStep, 
-                                  step_function, *args, **kwargs) -> ProcessResult:
-        """Ejecuta un paso con tracking, logging y manejo de errores unificado"""
-        step_name = step.value
-        step_descriptions = {
-            ProcessStep.STEP_01_SELECTION: "Copy Selection",
-            ProcessStep.STEP_02_EDIT_INFO: "Edit Information", 
-            ProcessStep.STEP_03_FINAL_SAVE: "Final Save"
-        }
+                                  step_function, *args, ready_selector: Optional[str] = None,
+                                  **kwargs) -> ProcessResult:
+        """
+        Ejecuta un paso con tracking, logging y manejo de errores unificado
         
-        description = step_descriptions.get(step, step_name)
+        ready_selector: selector CSS opcional que indica que la página quedó lista tras el paso
+        """
+        step_name = step.value
+        step_key = step_name.lower()  # Base de los nombres de tracking y screenshots
+        description = self._STEP_DESCRIPTIONS.get(step, step_name)
         
         try:
-            self.logger.info(f"🚀 Ejecutando {description}", module=SystemModule.FDA.value)
-            print(f"\n{ProcessMessages.STEP_INDICATOR.format(step=step_name, description=description)}")
+            self.logger.info("🚀 Ejecutando %s", description, module=_FDA_MODULE)
+            indicator = self._STEP_INDICATORS.get(step) or ProcessMessages.STEP_INDICATOR.format(
+                step=step_name, description=description
+            )
+            self._print(f"\n{indicator}")
             
             # Ejecutar con tracking
-            if self.performance_tracker:
-                track_name = f"fda_{step_name.lower()}"
-                with self.performance_tracker.track(track_name):
-                    success = step_function(driver, *args, **kwargs)
-            else:
-                success = step_function(driver, *args, **kwargs)
+            success = self._run_tracked(f"fda_{step_key}", step_function, driver, *args, **kwargs)
             
             if success:
-                self.logger.info(f"✅ {description} completado exitosamente", module=SystemModule.FDA.value)
-                if self.screenshot_manager:
-                    screenshot_name = f"{step_name.lower()}_completed"
-                    self.screenshot_manager.capture_success_screenshot(driver, screenshot_name)
+                self.logger.info("✅ %s completado exitosamente", description, module=_FDA_MODULE)
+                self._screenshot("success", driver, f"{step_key}_completed")
                 
                 # Pausa entre pasos
-                self._pause_between_steps()
+                self._pause_between_steps(driver, ready_selector)
                 
-                return ProcessResult(
+                return self._SUCCESS_RESULTS.get(step) or ProcessResult(
                     success=True,
                     step=step,
                     message=f"{description} completado"
                 )
             else:
                 error_msg = f"Fallo en {description}"
-                self.logger.error(error_msg, module=SystemModule.FDA.value)
-                if self.screenshot_manager:
-                    screenshot_name = f"{step_name.lower()}_failed"
-                    self.screenshot_manager.capture_error_screenshot(driver, screenshot_name)
+                self.logger.error(error_msg, module=_FDA_MODULE)
+                self._screenshot("error", driver, f"{step_key}_failed")
                 
                 return ProcessResult(
                     success=False,
@@ -205,11 +366,9 @@ class ProcessManager:
                 
         except Exception as e:
             error_msg = f"Error inesperado en {description}: {e}"
-            self.logger.error(error_msg, module=SystemModule.FDA.value, exception=e)
+            self.logger.error(error_msg, module=_FDA_MODULE, exception=e)
             
-            if self.screenshot_manager:
-                screenshot_name = f"{step_name.lower()}_error"
-                self.screenshot_manager.capture_error_screenshot(driver, screenshot_name, e)
+            self._screenshot("error", driver, f"{step_key}_error", e)
             
             return ProcessResult(
                 success=False,
@@ -218,11 +377,70 @@ class ProcessManager:
                 error=error_msg
             )
     
-    def _pause_between_steps(self):
-        """Pausa configurada entre pasos"""
-        self.logger.debug(f"⏸️ Pausa entre pasos ({SleepTimes.BETWEEN_STEPS}s)", module=SystemModule.FDA.value)
-        print(f"⏸️ Pausa entre pasos...")
-        time.sleep(SleepTimes.BETWEEN_STEPS)
+    def _pause_between_steps(self, driver: WebDriver, ready_selector: Optional[str] = None):
+        """Espera entre pasos hasta que la página esté lista (máximo BETWEEN_STEPS)"""
+        self.logger.debug("⏸️ Pausa entre pasos (hasta %ss)", SleepTimes.BETWEEN_STEPS, module=_FDA_MODULE)
+        self._print("⏸️ Pausa entre pasos...")
+        try:
+            self._wait(driver, SleepTimes.BETWEEN_STEPS, 0.1).until(_page_is_settled(ready_selector))
+        except TimeoutException:
+            self.logger.debug("⏳ Página aún cargando, se continúa", module=_FDA_MODULE)
+    
+    def _wait_for_staleness(self, driver: WebDriver, element, timeout: float):
+        """Espera a que el elemento salga del DOM; si no ocurre en timeout, continúa"""
+        try:
+            self._wait(driver, timeout, 0.1).until(EC.staleness_of(element))
+        except TimeoutException:
+            self.logger.debug("⏳ El elemento sigue en el DOM, se continúa", module=_FDA_MODULE)
+    
+    def _do_prior_notice_navigation(self, driver: WebDriver, wait: WebDriverWait):
+        """Enlace Prior Notice System -> submissions -> Copy del prior notice más reciente"""
+        # Paso 1: Buscar enlace "Prior Notice System Interface"
+        self.logger.info("🔍 Buscando enlace 'Prior Notice System Interface'", module=_FDA_MODULE)
+        self._print("🔍 Buscando enlace 'Prior Notice System Interface'...")
+        
+        prior_notice_link = wait.until(
+            EC.element_to_be_clickable(_PRIOR_NOTICE_LINK)
+        )
+        
+        prior_notice_link.click()
+        self.logger.info("✅ Navegando a Prior Notice System Interface", module=_FDA_MODULE)
+        self._print("✅ Accediendo a Prior Notice System Interface")
+        
+        # Sin pausa fija: la espera del botón 'submissions' sondea hasta que la página cargue
+        
+        # Paso 2: Navegar a submissions
+        self.logger.info("🔍 Buscando botón 'submissions'", module=_FDA_MODULE)
+        self._print("🔍 Buscando botón 'submissions'...")
+        
+        submissions_button = wait.until(
+            EC.element_to_be_clickable(_SUBMISSIONS_BUTTON)
+        )
+        
+        submissions_button.click()
+        self.logger.info("✅ Navegando a Previous Submissions & Drafts", module=_FDA_MODULE)
+        self._print("✅ Accediendo a Previous Submissions & Drafts")
+        
+        # Sin pausa fija: la espera de la tabla sondea hasta que aparezca
+        
+        # Paso 3: Botón "Copy" del primer prior notice (el más reciente) en una sola consulta
+        self.logger.info("🔍 Buscando el prior notice más reciente en la tabla", module=_FDA_MODULE)
+        self._print("🔍 Buscando prior notices disponibles...")
+        
+        try:
+            copy_button = wait.until(EC.element_to_be_clickable(_FIRST_ROW_COPY_BUTTON))
+        except TimeoutException:
+            raise Exception("No se encontraron prior notices con botón 'Copy' en la tabla")
+        
+        self.logger.info("🎯 Seleccionando el primer prior notice", module=_FDA_MODULE)
+        self._print("🎯 Seleccionando el primer prior notice...")
+        
+        copy_button.click()
+        self.logger.info("✅ Botón 'Copy' clickeado exitosamente", module=_FDA_MODULE)
+        self._print("✅ Prior notice seleccionado para copiar")
+        
+        # Esperar a que la tabla se reemplace (como máximo el tiempo de la pausa anterior)
+        self._wait_for_staleness(driver, copy_button, SleepTimes.SAVE_PROCESSING)
     
     def execute_navigation_to_prior_notice_system(self, driver: WebDriver) -> ProcessResult:
         """
@@ -230,182 +448,27 @@ class ProcessManager:
         Este paso es OBLIGATORIO después del login y antes de los steps
         """
         try:
-            self.logger.info("🏛️ Navegando al Prior Notice System Interface", module=SystemModule.FDA.value)
-            print(f"\n{ProcessMessages.STEP_INDICATOR.format(step='NAVIGATION', description='Prior Notice System Interface')}")
-            
-            # Importar aquí para evitar import circular
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support import expected_conditions as EC
+            self.logger.info("🏛️ Navegando al Prior Notice System Interface", module=_FDA_MODULE)
+            self._print(f"\n{self._STEP_INDICATORS[ProcessStep.NAVIGATION]}")
             
             # Crear wait para esta navegación
-            wait = WebDriverWait(driver, ElementTimeouts.DEFAULT)
-            
-            if self.performance_tracker:
-                with self.performance_tracker.track("navigate_to_prior_notice_system"):
-                    # Paso 1: Buscar enlace "Prior Notice System Interface"
-                    self.logger.info("🔍 Buscando enlace 'Prior Notice System Interface'", module=SystemModule.FDA.value)
-                    print("🔍 Buscando enlace 'Prior Notice System Interface'...")
-                    
-                    prior_notice_link = wait.until(
-                        EC.element_to_be_clickable((By.XPATH, "//a[@title='Prior Notice System Interface']"))
-                    )
-                    
-                    prior_notice_link.click()
-                    self.logger.info("✅ Navegando a Prior Notice System Interface", module=SystemModule.FDA.value)
-                    print("✅ Accediendo a Prior Notice System Interface")
-                    
-                    # Pausa para carga
-                    time.sleep(SleepTimes.FORM_LOAD)
-                    
-                    # Paso 2: Navegar a submissions
-                    self.logger.info("🔍 Buscando botón 'submissions'", module=SystemModule.FDA.value)
-                    print("🔍 Buscando botón 'submissions'...")
-                    
-                    submissions_button = wait.until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[@routerlink='/submissions']"))
-                    )
-                    
-                    submissions_button.click()
-                    self.logger.info("✅ Navegando a Previous Submissions & Drafts", module=SystemModule.FDA.value)
-                    print("✅ Accediendo a Previous Submissions & Drafts")
-                    
-                    # Pausa para carga de tabla
-                    time.sleep(SleepTimes.FORM_LOAD)
-                    
-                    # Paso 3: Buscar y seleccionar prior notice en la tabla
-                    self.logger.info("🔍 Buscando tabla de prior notices", module=SystemModule.FDA.value)
-                    print("🔍 Buscando tabla de prior notices...")
-                    
-                    # Esperar a que aparezca la tabla
-                    from src.constants.selectors import FDASelectors
-                    table = wait.until(
-                        EC.presence_of_element_located((By.XPATH, FDASelectors.PRIOR_NOTICE_TABLE))
-                    )
-                    self.logger.info("✅ Tabla de prior notices encontrada", module=SystemModule.FDA.value)
-                    print("✅ Tabla encontrada")
-                    
-                    # Buscar filas de la tabla
-                    self.logger.info("🔍 Buscando filas en la tabla", module=SystemModule.FDA.value)
-                    print("🔍 Buscando prior notices disponibles...")
-                    
-                    table_rows = wait.until(
-                        EC.presence_of_all_elements_located((By.XPATH, FDASelectors.TABLE_ROWS))
-                    )
-                    
-                    if not table_rows:
-                        raise Exception("No se encontraron prior notices en la tabla")
-                    
-                    self.logger.info(f"✅ Encontradas {len(table_rows)} filas en la tabla", module=SystemModule.FDA.value)
-                    print(f"✅ Encontrados {len(table_rows)} prior notices")
-                    
-                    # Seleccionar el primer prior notice (el más reciente)
-                    first_row = table_rows[0]
-                    self.logger.info("🎯 Seleccionando el primer prior notice", module=SystemModule.FDA.value)
-                    print("🎯 Seleccionando el primer prior notice...")
-                    
-                    # Buscar botón "Copy" en la primera fila
-                    copy_button = first_row.find_element(By.XPATH, FDASelectors.COPY_BUTTON)
-                    
-                    if not copy_button:
-                        raise Exception("No se encontró el botón 'Copy' en el prior notice seleccionado")
-                    
-                    copy_button.click()
-                    self.logger.info("✅ Botón 'Copy' clickeado exitosamente", module=SystemModule.FDA.value)
-                    print("✅ Prior notice seleccionado para copiar")
-                    
-                    # Pausa para procesamiento
-                    time.sleep(SleepTimes.SAVE_PROCESSING)
-            else:
-                # Mismo proceso sin tracking
-                self.logger.info("🔍 Buscando enlace 'Prior Notice System Interface'", module=SystemModule.FDA.value)
-                print("🔍 Buscando enlace 'Prior Notice System Interface'...")
-                
-                prior_notice_link = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//a[@title='Prior Notice System Interface']"))
-                )
-                
-                prior_notice_link.click()
-                self.logger.info("✅ Navegando a Prior Notice System Interface", module=SystemModule.FDA.value)
-                print("✅ Accediendo a Prior Notice System Interface")
-                
-                time.sleep(SleepTimes.FORM_LOAD)
-                
-                self.logger.info("🔍 Buscando botón 'submissions'", module=SystemModule.FDA.value)
-                print("🔍 Buscando botón 'submissions'...")
-                
-                submissions_button = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[@routerlink='/submissions']"))
-                )
-                
-                submissions_button.click()
-                self.logger.info("✅ Navegando a Previous Submissions & Drafts", module=SystemModule.FDA.value)
-                print("✅ Accediendo a Previous Submissions & Drafts")
-                
-                time.sleep(SleepTimes.FORM_LOAD)
-                
-                # Paso 3: Buscar y seleccionar prior notice en la tabla
-                self.logger.info("🔍 Buscando tabla de prior notices", module=SystemModule.FDA.value)
-                print("🔍 Buscando tabla de prior notices...")
-                
-                # Esperar a que aparezca la tabla
-                from src.constants.selectors import FDASelectors
-                table = wait.until(
-                    EC.presence_of_element_located((By.XPATH, FDASelectors.PRIOR_NOTICE_TABLE))
-                )
-                self.logger.info("✅ Tabla de prior notices encontrada", module=SystemModule.FDA.value)
-                print("✅ Tabla encontrada")
-                
-                # Buscar filas de la tabla
-                self.logger.info("🔍 Buscando filas en la tabla", module=SystemModule.FDA.value)
-                print("🔍 Buscando prior notices disponibles...")
-                
-                table_rows = wait.until(
-                    EC.presence_of_all_elements_located((By.XPATH, FDASelectors.TABLE_ROWS))
-                )
-                
-                if not table_rows:
-                    raise Exception("No se encontraron prior notices en la tabla")
-                
-                self.logger.info(f"✅ Encontradas {len(table_rows)} filas en la tabla", module=SystemModule.FDA.value)
-                print(f"✅ Encontrados {len(table_rows)} prior notices")
-                
-                # Seleccionar el primer prior notice (el más reciente)
-                first_row = table_rows[0]
-                self.logger.info("🎯 Seleccionando el primer prior notice", module=SystemModule.FDA.value)
-                print("🎯 Seleccionando el primer prior notice...")
-                
-                # Buscar botón "Copy" en la primera fila
-                copy_button = first_row.find_element(By.XPATH, FDASelectors.COPY_BUTTON)
-                
-                if not copy_button:
-                    raise Exception("No se encontró el botón 'Copy' en el prior notice seleccionado")
-                
-                copy_button.click()
-                self.logger.info("✅ Botón 'Copy' clickeado exitosamente", module=SystemModule.FDA.value)
-                print("✅ Prior notice seleccionado para copiar")
-                
-                # Pausa para procesamiento
-                time.sleep(SleepTimes.SAVE_PROCESSING)
+            wait = self._wait(driver, ElementTimeouts.DEFAULT)
+            
+            self._run_tracked("navigate_to_prior_notice_system", self._do_prior_notice_navigation, driver, wait)
             
             # Screenshot de confirmación
-            if self.screenshot_manager:
-                self.screenshot_manager.capture_step_screenshot(driver, "prior_notice_system_navigation")
+            self._screenshot("step", driver, "prior_notice_system_navigation")
             
-            self.logger.info("🎯 Navegación y selección de prior notice completada", module=SystemModule.FDA.value)
-            print("🎯 Prior notice seleccionado - Listo para crear copia")
+            self.logger.info("🎯 Navegación y selección de prior notice completada", module=_FDA_MODULE)
+            self._print("🎯 Prior notice seleccionado - Listo para crear copia")
             
-            return ProcessResult(
-                success=True,
-                step=ProcessStep.NAVIGATION,
-                message="Navegación y selección de prior notice exitosa"
-            )
+            return self._SUCCESS_RESULTS[ProcessStep.NAVIGATION]
             
         except Exception as e:
             error_msg = f"Error navegando al Prior Notice System: {e}"
-            self.logger.error(error_msg, module=SystemModule.FDA.value, exception=e)
+            self.logger.error(error_msg, module=_FDA_MODULE, exception=e)
             
-            if self.screenshot_manager:
-                self.screenshot_manager.capture_error_screenshot(driver, "prior_notice_navigation_error", e)
+            self._screenshot("error", driver, "prior_notice_navigation_error", e)
             
             return ProcessResult(
                 success=False,
@@ -415,65 +478,44 @@ class ProcessManager:
             )
     
     def execute_complete_prior_notice_process(self, driver: WebDriver) -> ProcessResult:
+        """Ejecuta el proceso completo de Prior Notice (bajo el profiler si está configurado)"""
+        with self.profiler or nullcontext():
+            return self._run_prior_notice_process(driver)
+    
+    def _run_prior_notice_process(self, driver: WebDriver) -> ProcessResult:
         """Ejecuta el proceso completo de Prior Notice con manejo estructurado"""
         try:
-            self.logger.info("📋 Iniciando automatización de Prior Notice", module=SystemModule.FDA.value)
-            print(f"\n{ProcessMessages.STEP_INDICATOR.format(step='PRIOR_NOTICE', description='Automatización Prior Notice')}")
-            print(f"💡 El proceso es mayormente automático")
-            print(f"👤 Solo necesitarás ingresar la fecha cuando se solicite")
+            self.logger.info("📋 Iniciando automatización de Prior Notice", module=_FDA_MODULE)
+            self._print(_PRIOR_NOTICE_INTRO_TEXT)
             
             # PASO 0: Navegación y selección de prior notice (NUEVO - OBLIGATORIO)
-            print("\n🏛️ Navegando al Prior Notice System y seleccionando prior notice...")
+            self._print("\n🏛️ Navegando al Prior Notice System y seleccionando prior notice...")
             navigation_result = self.execute_navigation_to_prior_notice_system(driver)
             
             if not navigation_result.success:
                 return navigation_result
             
-            print("✅ Prior notice seleccionado para copiar")
+            self._print("✅ Prior notice seleccionado para copiar")
             
-            # PASO 1: Copy Selection
-            result_step1 = self.execute_step_with_tracking(
-                driver, ProcessStep.STEP_01_SELECTION,
-                execute_step_01, SleepTimes.SHORT_WAIT
-            )
-            
-            if not result_step1.success:
-                return result_step1
-            
-            # PASO 2: Edit Information
-            result_step2 = self.execute_step_with_tracking(
-                driver, ProcessStep.STEP_02_EDIT_INFO,
-                execute_step_02, wait=SleepTimes.SHORT_WAIT
-            )
-            
-            if not result_step2.success:
-                return result_step2
-            
-            # PASO 3: Final Save
-            result_step3 = self.execute_step_with_tracking(
-                driver, ProcessStep.STEP_03_FINAL_SAVE,
-                execute_step_03, wait=SleepTimes.SHORT_WAIT
-            )
-            
-            if not result_step3.success:
-                return result_step3
+            # PASOS 1-3: Copy Selection, Edit Information, Final Save (se corta en el primer fallo)
+            for step, step_ref, step_args, step_kwargs in self._PRIOR_NOTICE_STEPS:
+                result = self.execute_step_with_tracking(
+                    driver, step, _load_step_function(*step_ref), *step_args, **step_kwargs
+                )
+                if not result.success:
+                    return result
             
             # Proceso completado exitosamente
-            self.logger.info("🎉 PROCESO DE PRIOR NOTICE COMPLETADO EXITOSAMENTE", module=SystemModule.FDA.value)
+            self.logger.info("🎉 PROCESO DE PRIOR NOTICE COMPLETADO EXITOSAMENTE", module=_FDA_MODULE)
             self._show_success_summary()
             
             # Screenshot final
-            if self.screenshot_manager:
-                self.screenshot_manager.capture_success_screenshot(driver, "prior_notice_creation_completed")
+            self._screenshot("success", driver, "prior_notice_creation_completed")
             
-            return ProcessResult(
-                success=True,
-                step=ProcessStep.COMPLETED,
-                message="Prior Notice creado exitosamente"
-            )
+            return self._SUCCESS_RESULTS[ProcessStep.COMPLETED]
             
         except KeyboardInterrupt:
-            self.logger.warning("⏹️ Proceso interrumpido por el usuario", module=SystemModule.FDA.value)
+            self.logger.warning("⏹️ Proceso interrumpido por el usuario", module=_FDA_MODULE)
             return ProcessResult(
                 success=False,
                 step=ProcessStep.COMPLETED,
@@ -482,10 +524,9 @@ class ProcessManager:
             )
         except Exception as e:
             error_msg = f"Error inesperado durante la creación: {e}"
-            self.logger.error(error_msg, module=SystemModule.FDA.value, exception=e)
+            self.logger.error(error_msg, module=_FDA_MODULE, exception=e)
             
-            if self.screenshot_manager:
-                self.screenshot_manager.capture_error_screenshot(driver, "prior_notice_creation_error", e)
+            self._screenshot("error", driver, "prior_notice_creation_error", e)
             
             return ProcessResult(
                 success=False,
@@ -496,41 +537,19 @@ class ProcessManager:
     
     def _show_success_summary(self):
         """Muestra resumen de éxito estandarizado"""
-        print(f"\n🎉 {LogMessages.PROCESS_COMPLETED.format(process='CREACIÓN DE PRIOR NOTICE')}")
-        print(ProcessMessages.SUCCESS_SUMMARY)
-        print("📊 Resumen de lo ejecutado:")
-        print("   ✅ Navegación: Prior notice seleccionado de la tabla")
-        print("   ✅ Paso 1: Copy Selection completado")
-        print("   ✅ Paso 2: Edit Information completado")
-        print("   ✅ Paso 3: Final Save completado")
-        print("\n🔗 El Prior Notice debería estar listo en FDA")
+        self._print(_SUCCESS_SUMMARY_TEXT)
     
     def show_final_status(self, success: bool, operation_type: str):
         """Muestra estado final con información útil"""
+        # Estado + tips para próxima ejecución en una sola escritura
         if success:
-            print(f"\n🎯 {ProcessMessages.FINAL_SUCCESS}")
-            print("📸 Se pueden tomar screenshots finales...")
-            print("📁 Archivos generados en:")
-            print(f"   • Data: data/")
-            print(f"   • Outputs: src/orders/output/")
-            print(f"   • Logs: logs/")
-            print(f"   • Screenshots: logs/screenshots/")
+            print(_FINAL_SUCCESS_WITH_TIPS_TEXT)
         else:
-            print(f"\n❌ El proceso de {operation_type} no se completó exitosamente")
-            print("🔍 Revisa los mensajes anteriores para identificar problemas")
-            print("📄 Logs detallados disponibles en: logs/")
-            print("📸 Screenshots de errores disponibles en: logs/screenshots/")
-        
-        # Tips para próxima ejecución
-        print(f"\n💡 Tips para próxima ejecución:")
-        print("   • Asegúrate de tener order.csv actualizado")
-        print("   • Verifica que FDA no haya cambiado su interfaz")
-        print("   • Revisa logs/ para análisis detallado")
-        print("   • Screenshots en logs/screenshots/ para debugging visual")
+            print(_FINAL_FAILURE_WITH_TIPS_TEMPLATE.format(operation_type=operation_type))
     
     def log_session_summary(self):
         """Log final con resumen de la sesión"""
         if self.performance_tracker:
             self.performance_tracker.log_session_summary()
         
-        self.logger.info("👋 Sistema finalizado", module=SystemModule.MAIN.value) 
\ No newline at end of file
+        self.logger.info("👋 Sistema finalizado", module=_MAIN_MODULE) 
\ No newline at end of file
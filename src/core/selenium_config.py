@@ -1,4 +1,7 @@
+import os
+
 from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from config.config import CHROMEDRIVER_PATH, WAIT_TIMEOUT
@@ -6,9 +9,18 @@ from config.config import CHROMEDRIVER_PATH, WAIT_TIMEOUT
 def setup_chrome_driver():
     """
     Configura e inicializa el driver de Chrome
+    (sin CHROMEDRIVER_PATH válido, Selenium Manager resuelve el driver)
+    
+    Usa pageLoadStrategy 'eager': driver.get vuelve en DOMContentLoaded; los pasos
+    esperan sus elementos con wait.until
     """
-    service = Service(executable_path=CHROMEDRIVER_PATH)
-    driver = webdriver.Chrome(service=service)
+    options = Options()
+    options.page_load_strategy = "eager"
+    if CHROMEDRIVER_PATH and os.path.exists(CHROMEDRIVER_PATH):
+        service = Service(executable_path=CHROMEDRIVER_PATH)
+    else:
+        service = Service()
+    driver = webdriver.Chrome(service=service, options=options)
     return driver
 
 def setup_wait(driver):
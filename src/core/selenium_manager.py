@@ -9,30 +9,157 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import WebDriverException, TimeoutException
+import atexit
+import base64
+import copy
 import os
+import sys
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Optional
 
-from ..constants.timeouts import DEFAULT_WAIT
+from ..constants.timeouts import DEFAULT_WAIT, PAGE_LOAD_TIMEOUT, SCRIPT_TIMEOUT
 from .logger import get_logger
 from ..utils.screenshot_utils import create_screenshot_manager
 
+# Argumentos fijos de Chrome (iguales para todas las instancias)
+_BASE_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    # Servicios en segundo plano que no usa la automatización
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--mute-audio",
+    # Tamaño de ventana fijo
+    "--window-size=1920,1080"
+)
+
+# Seguridad relajada: nunca se combina con el modo persistente (puerto de depuración abierto
+# sobre una sesión FDA autenticada)
+_RELAXED_SECURITY_ARGS = (
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+)
+
+# Un único --disable-features: Chrome solo respeta la última aparición del switch
+_DISABLED_FEATURES = "Translate,BackForwardCache,MediaRouter,OptimizationHints"
+# Sin aislamiento de sitios: menos procesos de renderer (solo con seguridad relajada)
+_DISABLED_ISOLATION_FEATURES = "IsolateOrigins,site-per-process"
+
+
+def _build_base_options(eco: bool, relaxed_security: bool) -> Options:
+    """Construye la parte fija de las opciones de Chrome (eco: sin imágenes)"""
+    options = Options()
+    for arg in _BASE_CHROME_ARGS:
+        options.add_argument(arg)
+    if relaxed_security:
+        for arg in _RELAXED_SECURITY_ARGS:
+            options.add_argument(arg)
+        options.add_argument(f"--disable-features={_DISABLED_FEATURES},{_DISABLED_ISOLATION_FEATURES}")
+    else:
+        options.add_argument(f"--disable-features={_DISABLED_FEATURES}")
+    if eco:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    
+    # Configuraciones adicionales para estabilidad
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    
+    # Deshabilitar notificaciones (las imágenes ya se cortan con --blink-settings)
+    prefs = {
+        "profile.default_content_setting_values.notifications": 2,
+        "profile.default_content_settings.popups": 0
+    }
+    options.add_experimental_option("prefs", prefs)
+    return options
+
+
+# URLs que en modo eco ni se piden a la red (complementa --blink-settings)
+_ECO_BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp"]
+
+# Plantillas armadas una sola vez por proceso, por (eco, seguridad relajada)
+_BASE_OPTIONS = {
+    (eco, relaxed): _build_base_options(eco, relaxed)
+    for eco in (True, False) for relaxed in (True, False)
+}
+
+# Título y URL de la página en una sola ida al navegador
+_PAGE_INFO_JS = "return [document.title, location.href];"
+
+# Endpoint (host:puerto) del Chrome persistente que sobrevive entre ejecuciones
+_PERSISTENT_ENDPOINT_FILE = Path.home() / ".charrua" / "chrome_endpoint"
+
+
+class TabSession:
+    """Pestaña propia dentro de un Chrome compartido (se identifica por su window handle)"""
+    __slots__ = ("driver", "window_handle")
+    
+    def __init__(self, driver: webdriver.Chrome, window_handle: str):
+        self.driver = driver
+        self.window_handle = window_handle
+    
+    def activate(self) -> webdriver.Chrome:
+        """Enfoca esta pestaña (si no es la actual) y devuelve el driver para operar en ella"""
+        if self.driver.current_window_handle != self.window_handle:
+            self.driver.switch_to.window(self.window_handle)
+        return self.driver
+    
+    def close(self):
+        """Cierra la pestaña"""
+        self.activate().close()
+
+
 class SeleniumManager:
     """
     Clase central para gestionar el driver de Selenium
     Proporciona configuración estándar, métodos de utilidad y logging integrado
+    
+    Sin timeout implícito: todas las esperas deben ser explícitas (WebDriverWait / get_wait)
     """
     
-    def __init__(self, headless: bool = False, user_data_dir: Optional[str] = None):
+    WAIT_POLL_FREQUENCY = 0.2  # Segundos entre sondeos de los WebDriverWait creados aquí
+    
+    # Drivers estacionados para reutilizar en el mismo proceso, por configuración completa (ver _cache_key)
+    _driver_cache: Dict[tuple, webdriver.Chrome] = {}
+    
+    # Ruta de ChromeDriver resuelta en el primer arranque (evita resolverla de nuevo)
+    _resolved_driver_path: Optional[str] = None
+    
+    def __init__(self, headless: bool = False, user_data_dir: Optional[str] = None,
+                 keep_alive: bool = False, page_load_strategy: str = "eager", eco: bool = True,
+                 maximize: bool = False, persistent: bool = False, debug_port: int = 9222,
+                 page_load_timeout: int = PAGE_LOAD_TIMEOUT, script_timeout: int = SCRIPT_TIMEOUT):
         """
         Inicializa el manager de Selenium con logging integrado
         
         Args:
             headless: Si ejecutar Chrome en modo headless
             user_data_dir: Directorio de datos de usuario de Chrome
+            keep_alive: Si al cerrar se estaciona el driver para reutilizarlo en vez de hacer quit()
+            page_load_strategy: 'eager' (driver.get vuelve en DOMContentLoaded) o 'normal' (espera load)
+            eco: Si deshabilitar la carga de imágenes (menos memoria y red)
+            maximize: Si maximizar la ventana al iniciar (solo modo visible; provoca un segundo layout)
+            persistent: Si reutilizar entre ejecuciones un Chrome con depuración remota (ver start_driver);
+                        close_driver no lo cierra y, al reconectarse, ver attach_to_existing.
+                        Opt-in: el puerto escucha solo en 127.0.0.1 y Chrome se lanza sin
+                        --disable-web-security ni el aislamiento de sitios deshabilitado
+            debug_port: Puerto de depuración remota del Chrome persistente
+            page_load_timeout: Segundos máximos de driver.get antes de TimeoutException
+            script_timeout: Segundos máximos de los scripts asíncronos
         """
         self.headless = headless
         self.user_data_dir = user_data_dir or self._get_default_user_data_dir()
+        self.keep_alive = keep_alive
+        self.page_load_strategy = page_load_strategy
+        self.eco = eco
+        self.maximize = maximize
+        self.persistent = persistent
+        self.debug_port = debug_port
+        self.page_load_timeout = page_load_timeout
+        self.script_timeout = script_timeout
         self.driver = None
         self.wait = None
         
@@ -49,28 +176,18 @@ class SeleniumManager:
     
     def _setup_chrome_options(self) -> Options:
         """
-        Configura las opciones de Chrome con logging detallado
+        Configura las opciones de Chrome a partir de la plantilla base precalculada
         
         Returns:
             Options configuradas para Chrome
         """
         self.logger.debug("🔧 Configurando opciones de Chrome", module='selenium')
         
-        options = Options()
-        
-        # Configuraciones básicas
-        basic_args = [
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
-            "--disable-extensions",
-            "--disable-web-security",
-            "--allow-running-insecure-content"
-        ]
-        
-        for arg in basic_args:
-            options.add_argument(arg)
-            self.logger.debug(f"   + Argumento: {arg}", module='selenium')
+        # Copia profunda: Selenium puede completar la instancia (p. ej. binary_location)
+        # El modo persistente usa la plantilla sin seguridad relajada ni aislamiento deshabilitado
+        options = copy.deepcopy(_BASE_OPTIONS[(self.eco, not self.persistent)])
+        options.page_load_strategy = self.page_load_strategy
+        self.logger.debug(f"   + Page load strategy: {self.page_load_strategy}", module='selenium')
         
         # User data directory para mantener sesión
         if self.user_data_dir:
@@ -79,34 +196,26 @@ class SeleniumManager:
         
         # Modo headless si se especifica
         if self.headless:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
             self.logger.info("   🕶️ Modo headless habilitado", module='selenium')
+            # GPU solo se deshabilita donde hace falta (headless en Linux, típicamente sin GPU)
+            if sys.platform.startswith("linux"):
+                options.add_argument("--disable-gpu")
         
-        # Configuraciones de ventana
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--start-maximized")
-        
-        # Configuraciones adicionales para estabilidad
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Deshabilitar notificaciones
-        prefs = {
-            "profile.default_content_setting_values.notifications": 2,
-            "profile.default_content_settings.popups": 0,
-            "profile.managed_default_content_settings.images": 2  # Opcional: deshabilitar imágenes para velocidad
-        }
-        options.add_experimental_option("prefs", prefs)
+        # Maximizar re-calcula el layout: solo si se pide y hay ventana visible
+        if self.maximize and not self.headless:
+            options.add_argument("--start-maximized")
         
         self.logger.info("✅ Opciones de Chrome configuradas", module='selenium')
         return options
     
-    def start_driver(self, driver_path: str = "./drivers/chromedriver") -> webdriver.Chrome:
+    def start_driver(self, driver_path: Optional[str] = "./drivers/chromedriver") -> webdriver.Chrome:
         """
         Inicia el driver de Chrome con logging completo y screenshots automáticos
         
         Args:
-            driver_path: Ruta al ejecutable de ChromeDriver
+            driver_path: Ruta al ejecutable de ChromeDriver; si no existe, Selenium Manager
+                         descarga/resuelve la versión compatible (Selenium 4.11+)
             
         Returns:
             Driver de Chrome configurado
@@ -114,43 +223,66 @@ class SeleniumManager:
         Raises:
             Exception: Si no se puede iniciar el driver
         """
+        cached_driver = self._driver_cache.get(self._cache_key)
+        if cached_driver is not None:
+            if self._is_alive(cached_driver):
+                return self._attach_driver(cached_driver)
+            del self._driver_cache[self._cache_key]
+        
         try:
             self.logger.info("🔄 Iniciando driver de Chrome...", module='selenium')
+            start_time = time.time()
             
-            # Verificar que el driver existe
-            if not os.path.exists(driver_path):
-                error_msg = f"ChromeDriver no encontrado en: {driver_path}"
-                self.logger.error(error_msg, module='selenium')
-                raise FileNotFoundError(error_msg)
-            
-            self.logger.debug(f"✅ ChromeDriver encontrado en: {driver_path}", module='selenium')
+            # Modo persistente: conectarse al Chrome de una ejecución anterior si sigue vivo
+            debugger_address = self._read_persistent_endpoint() if self.persistent else None
+            if debugger_address:
+                try:
+                    self.attach_to_existing(debugger_address, driver_path)
+                except WebDriverException as e:
+                    self.logger.warning(f"⚠️ Chrome persistente no disponible ({debugger_address}): {e}", module='selenium')
+                    _PERSISTENT_ENDPOINT_FILE.unlink(missing_ok=True)
             
-            # Configurar el servicio
-            service = Service(driver_path)
-            self.logger.debug("🔧 Servicio de Chrome configurado", module='selenium')
+            if self.driver is None:
+                # Configurar opciones
+                options = self._setup_chrome_options()
+                if self.persistent:
+                    # Chrome sigue abierto al cerrar el driver, para reutilizarlo en la próxima ejecución
+                    # Solo loopback: el puerto da control total de la sesión autenticada
+                    options.add_argument("--remote-debugging-address=127.0.0.1")
+                    options.add_argument(f"--remote-debugging-port={self.debug_port}")
+                    options.add_experimental_option("detach", True)
+                
+                # Crear el driver
+                self.driver = self._create_chrome(driver_path, options)
+                if self.persistent:
+                    self._write_persistent_endpoint(f"127.0.0.1:{self.debug_port}")
+            startup_time = time.time() - start_time
             
-            # Configurar opciones
-            options = self._setup_chrome_options()
+            if self.eco:
+                self._block_image_requests()
             
-            # Crear el driver
-            start_time = time.time()
-            self.driver = webdriver.Chrome(service=service, options=options)
-            startup_time = time.time() - start_time
+            # Sin timeout implícito: se suma a cada sondeo fallido de las esperas explícitas
+            self.driver.implicitly_wait(0)
             
-            # Configurar timeouts implícitos
-            self.driver.implicitly_wait(DEFAULT_WAIT)
+            # Una página colgada falla rápido en vez de bloquear driver.get indefinidamente
+            self.driver.set_page_load_timeout(self.page_load_timeout)
+            self.driver.set_script_timeout(self.script_timeout)
             
             # Crear WebDriverWait
-            self.wait = WebDriverWait(self.driver, DEFAULT_WAIT)
+            self.wait = WebDriverWait(self.driver, DEFAULT_WAIT, poll_frequency=self.WAIT_POLL_FREQUENCY)
             
             # Inicializar screenshot manager
             self.screenshot_manager = create_screenshot_manager(self.logger)
             
+            # El modo persistente ya reutiliza Chrome; no se estaciona (quit_cached_drivers lo cerraría)
+            if self.keep_alive and not self.persistent:
+                self._driver_cache[self._cache_key] = self.driver
+            
             # Logs de éxito
             self.logger.info(f"✅ Driver de Chrome iniciado exitosamente ({startup_time:.2f}s)", module='selenium')
             self.logger.info(f"   📁 User data dir: {self.user_data_dir}", module='selenium')
             self.logger.info(f"   🖥️ Headless: {self.headless}", module='selenium')
-            self.logger.info(f"   ⏱️ Timeout implícito: {DEFAULT_WAIT}s", module='selenium')
+            self.logger.info(f"   ⏱️ Espera explícita por defecto: {DEFAULT_WAIT}s", module='selenium')
             
             print(f"✅ Driver de Chrome iniciado exitosamente")
             print(f"   📁 User data dir: {self.user_data_dir}")
@@ -161,7 +293,7 @@ class SeleniumManager:
                 try:
                     # Navegar a about:blank para screenshot inicial
                     self.driver.get("about:blank")
-                    self.screenshot_manager.capture_screenshot(self.driver, "driver_startup", "INFO")
+                    self.screenshot_manager.capture_screenshot_async(self.driver, "driver_startup", "INFO")
                 except:
                     pass  # No fallar por screenshot inicial
             
@@ -173,12 +305,140 @@ class SeleniumManager:
             print(f"❌ Error iniciando driver de Chrome: {e}")
             raise
     
-    def get_wait(self, timeout: Optional[int] = None) -> WebDriverWait:
+    def _create_chrome(self, driver_path: Optional[str], options: Options) -> webdriver.Chrome:
+        """Crea el driver con la ruta de ChromeDriver ya resuelta, la ruta local o Selenium Manager"""
+        resolved_path = SeleniumManager._resolved_driver_path
+        if resolved_path is None and driver_path and os.path.exists(driver_path):
+            resolved_path = driver_path
+        
+        if resolved_path:
+            service = Service(resolved_path)
+            self.logger.debug(f"✅ ChromeDriver: {resolved_path}", module='selenium')
+        else:
+            service = Service()
+            self.logger.debug("🔎 ChromeDriver local no encontrado, usando Selenium Manager", module='selenium')
+        self.logger.debug("🔧 Servicio de Chrome configurado", module='selenium')
+        
+        driver = webdriver.Chrome(service=service, options=options)
+        # Selenium Manager completa service.path al arrancar; se guarda para el próximo arranque
+        SeleniumManager._resolved_driver_path = getattr(service, "path", None) or resolved_path
+        return driver
+    
+    def attach_to_existing(self, debugger_address: str,
+                           driver_path: Optional[str] = "./drivers/chromedriver") -> webdriver.Chrome:
+        """
+        Conecta un driver a un Chrome ya abierto con depuración remota, sin lanzar uno nuevo
+        
+        Chrome ya está corriendo, así que las opciones de lanzamiento no aplican: user_data_dir,
+        headless, maximize y el --blink-settings de eco son los del Chrome original. Sí aplican
+        page_load_strategy y, desde start_driver, los timeouts y el bloqueo de imágenes vía CDP (eco).
+        
+        Args:
+            debugger_address: Dirección host:puerto del Chrome (--remote-debugging-port)
+            driver_path: Ruta al ejecutable de ChromeDriver
+            
+        Returns:
+            Driver conectado al Chrome existente
+        """
+        options = Options()
+        options.page_load_strategy = self.page_load_strategy
+        options.add_experimental_option("debuggerAddress", debugger_address)
+        
+        self.driver = self._create_chrome(driver_path, options)
+        self.logger.info(f"🔌 Conectado a Chrome existente en {debugger_address}", module='selenium')
+        return self.driver
+    
+    def _block_image_requests(self):
+        """Bloquea vía CDP las descargas de imágenes (si el driver no soporta CDP, se omite)"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _ECO_BLOCKED_URLS})
+        except (AttributeError, WebDriverException) as e:
+            self.logger.debug(f"   ⚠️ No se pudieron bloquear imágenes vía CDP: {e}", module='selenium')
+    
+    def new_tab_session(self) -> TabSession:
+        """
+        Abre una pestaña nueva en el Chrome actual (típicamente el persistente/compartido)
+        
+        Cada TabSession debe llamar a activate() antes de operar; el driver no es thread-safe,
+        así que las pestañas se alternan desde un mismo hilo.
+        """
+        if not self.driver:
+            raise RuntimeError("Driver no iniciado")
+        
+        self.driver.switch_to.new_window('tab')
+        self.logger.debug("🗂️ Nueva pestaña abierta", module='selenium')
+        return TabSession(self.driver, self.driver.current_window_handle)
+    
+    @staticmethod
+    def _read_persistent_endpoint() -> Optional[str]:
+        """Endpoint guardado por una ejecución persistente anterior (None si no hay o no es loopback)"""
+        try:
+            endpoint = _PERSISTENT_ENDPOINT_FILE.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        return endpoint if endpoint.startswith("127.0.0.1:") else None
+    
+    @staticmethod
+    def _write_persistent_endpoint(debugger_address: str):
+        """Guarda el endpoint del Chrome persistente para las próximas ejecuciones (solo legible por el usuario)"""
+        _PERSISTENT_ENDPOINT_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(_PERSISTENT_ENDPOINT_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if hasattr(os, "fchmod"):  # POSIX: un archivo previo puede tener permisos más abiertos
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(debugger_address)
+    
+    @property
+    def _cache_key(self) -> tuple:
+        """Todo lo que fija el driver al crearse: un driver estacionado solo sirve con la misma configuración"""
+        return (self.headless, self.user_data_dir, self.eco, self.page_load_strategy, self.maximize,
+                self.page_load_timeout, self.script_timeout)
+    
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        """Verifica que la sesión del driver siga respondiendo"""
+        try:
+            driver.title
+            return True
+        except WebDriverException:
+            return False
+    
+    def _attach_driver(self, driver: webdriver.Chrome) -> webdriver.Chrome:
+        """Reutiliza un driver estacionado sin pagar el arranque de Chrome"""
+        self.driver = driver
+        self.wait = WebDriverWait(driver, DEFAULT_WAIT, poll_frequency=self.WAIT_POLL_FREQUENCY)
+        self.screenshot_manager = create_screenshot_manager(self.logger)
+        self.logger.info("♻️ Reutilizando driver de Chrome existente", module='selenium')
+        print("♻️ Reutilizando driver de Chrome existente")
+        return driver
+    
+    def reset_session(self):
+        """Aísla la próxima ejecución sin cerrar Chrome (borra cookies y vuelve a about:blank)"""
+        if not self.driver:
+            raise RuntimeError("Driver no iniciado")
+        
+        self.driver.delete_all_cookies()
+        self.driver.get("about:blank")
+        self.logger.debug("🧹 Sesión del driver reiniciada", module='selenium')
+    
+    @classmethod
+    def quit_cached_drivers(cls):
+        """Cierra todos los drivers estacionados (se ejecuta también al salir del proceso)"""
+        while cls._driver_cache:
+            _, driver = cls._driver_cache.popitem()
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+    
+    def get_wait(self, timeout: Optional[int] = None, poll_frequency: Optional[float] = None) -> WebDriverWait:
         """
         Obtiene una instancia de WebDriverWait
         
         Args:
             timeout: Timeout personalizado (usa el default si no se especifica)
+            poll_frequency: Intervalo de sondeo (usa WAIT_POLL_FREQUENCY si no se especifica)
             
         Returns:
             WebDriverWait instance
@@ -186,8 +446,11 @@ class SeleniumManager:
         if not self.driver:
             raise RuntimeError("Driver no iniciado. Llama a start_driver() primero")
         
-        if timeout:
-            return WebDriverWait(self.driver, timeout)
+        if timeout or poll_frequency:
+            return WebDriverWait(
+                self.driver, timeout or DEFAULT_WAIT,
+                poll_frequency=poll_frequency or self.WAIT_POLL_FREQUENCY
+            )
         
         return self.wait
     
@@ -198,14 +461,25 @@ class SeleniumManager:
                 # Screenshot final
                 if self.screenshot_manager:
                     try:
-                        self.screenshot_manager.capture_screenshot(self.driver, "session_end", "INFO")
+                        self.screenshot_manager.capture_screenshot_async(self.driver, "session_end", "INFO")
                     except:
                         pass
                 
-                # Cerrar driver
-                self.driver.quit()
-                self.logger.info("🔧 Driver cerrado exitosamente", module='selenium')
-                print("🔧 Driver cerrado exitosamente")
+                # Estacionar para reutilizar o cerrar driver
+                is_cached = self._driver_cache.get(self._cache_key) is self.driver
+                if self.keep_alive and is_cached:
+                    self.logger.info("🅿️ Driver estacionado para reutilizar", module='selenium')
+                elif self.persistent:
+                    # quit() cerraría el Chrome persistente: solo se detiene ChromeDriver
+                    self.driver.service.stop()
+                    self.logger.info("🔌 Desconectado del Chrome persistente (sigue abierto)", module='selenium')
+                    print("🔌 Chrome persistente sigue abierto para la próxima ejecución")
+                else:
+                    if is_cached:
+                        del self._driver_cache[self._cache_key]
+                    self.driver.quit()
+                    self.logger.info("🔧 Driver cerrado exitosamente", module='selenium')
+                    print("🔧 Driver cerrado exitosamente")
                 
                 # Log de summary de screenshots
                 if self.screenshot_manager:
@@ -222,29 +496,43 @@ class SeleniumManager:
     
     def take_screenshot(self, filename: str = None) -> str:
         """
-        Toma una captura de pantalla
+        Toma una captura de pantalla; por defecto en JPEG vía CDP (más liviana que el PNG de WebDriver)
         
         Args:
-            filename: Nombre del archivo (opcional)
+            filename: Nombre del archivo (opcional); con extensión .png se respeta y se guarda PNG
             
         Returns:
-            Ruta del archivo guardado
+            Ruta real del archivo guardado (.png si se pidió PNG o si CDP no está disponible)
         """
         if not self.driver:
             raise RuntimeError("Driver no iniciado")
         
         if not filename:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}.png"
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            filename = f"screenshot_{timestamp}.jpg"
         
         # Crear directorio si no existe
         screenshots_dir = "screenshots"
         os.makedirs(screenshots_dir, exist_ok=True)
         
         filepath = os.path.join(screenshots_dir, filename)
-        self.driver.save_screenshot(filepath)
+        base_path, extension = os.path.splitext(filepath)
+        if extension.lower() != ".png":
+            try:
+                result = self.driver.execute_cdp_cmd("Page.captureScreenshot", {
+                    "format": "jpeg",
+                    "quality": 70,
+                    "captureBeyondViewport": False
+                })
+                with open(filepath, "wb") as f:
+                    f.write(base64.b64decode(result["data"]))
+                print(f"📸 Captura guardada: {filepath}")
+                return filepath
+            except (AttributeError, WebDriverException):
+                # Driver sin CDP: se cae al PNG de WebDriver con la extensión que corresponde
+                filepath = f"{base_path}.png"
         
+        self.driver.save_screenshot(filepath)
         print(f"📸 Captura guardada: {filepath}")
         return filepath
     
@@ -263,15 +551,19 @@ class SeleniumManager:
             self.logger.info(f"🌐 Navegando a: {url}", module='selenium')
             start_time = time.time()
             
-            self.driver.get(url)
+            try:
+                self.driver.get(url)
+            except TimeoutException:
+                # Suele ser un recurso lento (trackers) que retrasa 'load'; el DOM ya es usable
+                self.logger.warning(f"⚠️ Timeout de carga ({self.page_load_timeout}s), deteniendo la página", module='selenium')
+                self.driver.execute_script("window.stop();")
             
             navigation_time = time.time() - start_time
             self.logger.info(f"✅ Navegación completada ({navigation_time:.2f}s)", module='selenium')
             
-            # Información adicional de la página
+            # Información adicional de la página (título y URL en una sola llamada, solo para el log)
             try:
-                page_title = self.driver.title
-                current_url = self.driver.current_url
+                page_title, current_url = self.driver.execute_script(_PAGE_INFO_JS)
                 self.logger.debug(f"   📄 Título: {page_title}", module='selenium')
                 self.logger.debug(f"   🔗 URL final: {current_url}", module='selenium')
             except:
@@ -281,7 +573,7 @@ class SeleniumManager:
             if take_screenshot and self.screenshot_manager:
                 try:
                     clean_url = url.replace('https://', '').replace('http://', '').replace('/', '_')
-                    self.screenshot_manager.capture_screenshot(self.driver, f"navigation_{clean_url}", "INFO")
+                    self.screenshot_manager.capture_screenshot_async(self.driver, f"navigation_{clean_url}", "INFO")
                 except:
                     self.logger.warning("⚠️ No se pudo capturar screenshot de navegación", module='selenium')
             
@@ -322,6 +614,8 @@ class SeleniumManager:
         """Cierra el driver automáticamente al salir del context"""
         self.close_driver()
 
+atexit.register(SeleniumManager.quit_cached_drivers)
+
 # Función de conveniencia para compatibilidad con código existente
 def setup_chrome_driver(headless: bool = False, user_data_dir: Optional[str] = None) -> webdriver.Chrome:
     """
@@ -1,15 +1,52 @@
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from config.config import FDA_LOGIN_URL, USERNAME, PASSWORD
+from src.constants.selectors import FDASelectors
 from src.core.logger import AutomationLogger
 
-# Inicializar logger
-logger = AutomationLogger.get_instance()
+
+def _get_logger():
+    """Logger del módulo, obtenido al usarse (importar el módulo no inicializa el logging)"""
+    return AutomationLogger.get_instance()
+
+
+# Los tres campos del formulario en una sola ida al navegador; el checkbox además debe
+# estar visible y habilitado (equivalente a element_to_be_clickable)
+_LOGIN_FIELDS_JS = """
+const [user, password, understand] = arguments[0].map(name => document.getElementsByName(name)[0]);
+if (!user || !password || !understand) return null;
+if (understand.disabled || understand.offsetParent === null) return null;
+return [user, password, understand];
+"""
+_LOGIN_FIELD_NAMES = [
+    FDASelectors.USERNAME_INPUT, FDASelectors.PASSWORD_INPUT, FDASelectors.UNDERSTAND_CHECKBOX
+]
+
+
+def _login_fields_ready(driver):
+    """Condición de espera: devuelve [usuario, contraseña, checkbox] cuando están listos"""
+    return driver.execute_script(_LOGIN_FIELDS_JS, _LOGIN_FIELD_NAMES)
+
+
+def _insert_text(driver, field, text):
+    """
+    Escribe text en field con un solo Input.insertText de CDP (sin un evento de tecla por carácter)
+    
+    Si el driver no soporta CDP, usa send_keys.
+    """
+    field.clear()
+    field.click()  # insertText escribe en el elemento con foco
+    try:
+        driver.execute_cdp_cmd("Input.insertText", {"text": text})
+    except (AttributeError, WebDriverException):
+        field.send_keys(text)
 
 def navigate_to_login(driver):
     """
     Navega a la página de login de FDA
     """
+    logger = _get_logger()
     logger.fda_logger.info("Iniciando navegación a página de login FDA", extra={"url": FDA_LOGIN_URL})
     driver.get(FDA_LOGIN_URL)
     logger.fda_logger.info("Navegación a página de login FDA completada")
@@ -18,26 +55,23 @@ def fill_login_form(driver, wait):
     """
     Completa el formulario de login con usuario, contraseña y checkbox
     """
+    logger = _get_logger()
     logger.fda_logger.info("Iniciando llenado de formulario de login")
     
     try:
+        # Localizar usuario, contraseña y checkbox "understand" con un único sondeo
+        logger.fda_logger.debug("Localizando campos del formulario de login")
+        username_field, password_field, understand_checkbox = wait.until(_login_fields_ready)
+        
         # Completar campo de usuario
-        logger.fda_logger.debug("Localizando campo de usuario")
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "userName")))
-        username_field.clear()
-        username_field.send_keys(USERNAME)
+        _insert_text(driver, username_field, USERNAME)
         logger.fda_logger.debug("Campo de usuario completado")
         
         # Completar campo de contraseña
-        logger.fda_logger.debug("Localizando campo de contraseña")
-        password_field = wait.until(EC.presence_of_element_located((By.NAME, "password")))
-        password_field.clear()
-        password_field.send_keys(PASSWORD)
+        _insert_text(driver, password_field, PASSWORD)
         logger.fda_logger.debug("Campo de contraseña completado")
         
         # Marcar checkbox "understand"
-        logger.fda_logger.debug("Localizando checkbox 'understand'")
-        understand_checkbox = wait.until(EC.element_to_be_clickable((By.NAME, "understand")))
         if not understand_checkbox.is_selected():
             understand_checkbox.click()
             logger.fda_logger.debug("Checkbox 'understand' marcado")
@@ -51,6 +85,7 @@ def submit_login_form(driver, wait):
     """
     Envía el formulario de login
     """
+    logger = _get_logger()
     logger.fda_logger.info("Enviando formulario de login")
     
     try:
@@ -65,6 +100,7 @@ def handle_two_factor_auth(driver, wait):
     """
     Maneja la autenticación de dos factores
     """
+    logger = _get_logger()
     logger.fda_logger.info("Iniciando proceso de autenticación de dos factores")
     
     try:
@@ -93,6 +129,7 @@ def complete_fda_login(driver, wait):
     """
     Ejecuta el proceso completo de login de FDA
     """
+    logger = _get_logger()
     logger.fda_logger.info("=== INICIANDO PROCESO COMPLETO DE LOGIN FDA ===")
     
     try:
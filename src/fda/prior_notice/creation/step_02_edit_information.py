@@ -13,7 +13,6 @@ Mejoras implementadas:
 import csv
 import os
 import re
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
@@ -21,7 +20,7 @@ import time
 
 # Imports de la nueva arquitectura
 from src.constants.timeouts import SleepTimes, ElementTimeouts
-from src.constants.selectors import FDASelectors
+from src.constants.selectors import FDASelectors, FDALocators
 from src.constants.messages import LogMessages, UserMessages, ProcessMessages
 from src.constants.paths import ORDER_SAMPLE_FILE
 from src.utils.selenium_helpers import ElementFinder, ClickHelper, InputHelper, DebugHelper, WaitHelper
@@ -141,7 +140,7 @@ def update_tracking_number(driver, wait, guia_aerea):
         
         # Usando selector centralizado
         tracking_input = wait.until(
-            EC.presence_of_element_located((By.ID, FDASelectors.TRACKING_NUMBER_INPUT))
+            EC.presence_of_element_located(FDALocators.TRACKING_NUMBER_INPUT)
         )
         
         logger.fda_logger.debug("Campo trackingNumber encontrado")
@@ -188,7 +187,7 @@ def update_state_to_tennessee(driver, wait):
         
         # Usando selector centralizado
         state_select = wait.until(
-            EC.presence_of_element_located((By.NAME, FDASelectors.STATE_SELECT))
+            EC.presence_of_element_located(FDALocators.STATE_SELECT)
         )
         
         logger.fda_logger.debug("Select state encontrado")
@@ -248,7 +247,7 @@ def update_port_of_arrival_date(driver, wait):
         
         # Usando selector centralizado
         date_input = wait.until(
-            EC.presence_of_element_located((By.ID, FDASelectors.PORT_ARRIVAL_DATE_INPUT))
+            EC.presence_of_element_located(FDALocators.PORT_ARRIVAL_DATE_INPUT)
         )
         
         print(LogMessages.ELEMENT_FOUND.format(element="campo portOfArrivalDate"))
@@ -386,7 +385,7 @@ def click_save_and_continue_button(driver, wait):
         save_selectors = [
             FDASelectors.SAVE_CONTINUE_BUTTON,
             "//button[contains(text(), 'Save')]//span[contains(text(), 'Continue')]",
-            f"//button[@class='{FDASelectors.SAVE_CONTINUE_CLASS}']",
+            FDASelectors.SAVE_CONTINUE_BY_CLASS,
             "//span[contains(text(), 'Save & Continue')]/parent::button",
             "//button[.//span[contains(text(), 'Save & Continue')]]"
         ]
@@ -69,7 +69,7 @@ def click_second_save_and_continue(driver, wait):
             "//button[text()='SAVE & CONTINUE']",
             "//button[contains(text(), 'SAVE & CONTINUE')]",
             "//span[text()='Save & Continue']/parent::button",
-            f"//button[@class='{FDASelectors.SAVE_CONTINUE_CLASS}']",
+            FDASelectors.SAVE_CONTINUE_BY_CLASS,
             "//button[contains(@class, 'button-stepper')]//span[contains(text(), 'Save')]"
         ]
         
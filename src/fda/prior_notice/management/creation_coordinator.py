@@ -34,7 +34,7 @@ def navigate_to_prior_notice_system_only(driver, wait):
         
         # Buscar el enlace del Prior Notice System Interface
         prior_notice_link = wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//a[@title='Prior Notice System Interface']"))
+            EC.element_to_be_clickable((By.CSS_SELECTOR, "a[title='Prior Notice System Interface']"))
         )
         
         prior_notice_link.click()
@@ -45,7 +45,7 @@ def navigate_to_prior_notice_system_only(driver, wait):
         # Navegar a submissions
         logger.fda_logger.debug("Buscando botón de submissions")
         submissions_button = wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[@routerlink='/submissions']"))
+            EC.element_to_be_clickable((By.CSS_SELECTOR, "button[routerlink='/submissions']"))
         )
         
         submissions_button.click()
@@ -6,11 +6,24 @@ Proporciona funciones reutilizables comunes y patrones DRY
 from typing import Dict, List, Optional, Callable, Any
 from functools import wraps
 import time
+from pathlib import Path
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 
 from ..constants.enums import ProcessStep, ProcessResult, SystemModule
-from ..constants.timings import SleepTimes
+from ..constants.timeouts import SleepTimes
+
+# Nombre de módulo para logs, resuelto una vez al importar
+_FDA_MODULE = SystemModule.FDA.value
+
+# Estrategias de búsqueda aceptadas por validate_element_present
+_BY_METHODS = {
+    'css': By.CSS_SELECTOR,
+    'xpath': By.XPATH,
+    'id': By.ID,
+    'class': By.CLASS_NAME
+}
 
 
 class CommonPatterns:
@@ -59,12 +72,15 @@ class CommonPatterns:
     def track_performance(performance_tracker, operation_name: str):
         """Decorador común para tracking de performance"""
         def decorator(func):
+            # Sin tracker no hay nada que envolver
+            if not performance_tracker:
+                return func
+            
+            track = performance_tracker.track
+            
             @wraps(func)
             def wrapper(*args, **kwargs):
-                if performance_tracker:
-                    with performance_tracker.track(operation_name):
-                        return func(*args, **kwargs)
-                else:
+                with track(operation_name):
                     return func(*args, **kwargs)
             return wrapper
         return decorator
@@ -92,7 +108,7 @@ class StepExecutionTemplate:
         
         try:
             # Log inicial
-            self.logger.info(f"🚀 Ejecutando {step_description}", module=SystemModule.FDA.value)
+            self.logger.info(f"🚀 Ejecutando {step_description}", module=_FDA_MODULE)
             print(f"\n📋 PASO {step_name}: {step_description}")
             
             # Ejecutar con tracking opcional
@@ -115,7 +131,7 @@ class StepExecutionTemplate:
     def _handle_step_success(self, driver: WebDriver, step: ProcessStep, 
                            description: str) -> ProcessResult:
         """Manejo común de éxito de paso"""
-        self.logger.info(f"✅ {description} completado exitosamente", module=SystemModule.FDA.value)
+        self.logger.info(f"✅ {description} completado exitosamente", module=_FDA_MODULE)
         
         if self.screenshot_manager:
             screenshot_name = f"{step.value.lower()}_completed"
@@ -134,7 +150,7 @@ class StepExecutionTemplate:
                            description: str) -> ProcessResult:
         """Manejo común de fallo de paso"""
         error_msg = f"Fallo en {description}"
-        self.logger.error(error_msg, module=SystemModule.FDA.value)
+        self.logger.error(error_msg, module=_FDA_MODULE)
         
         if self.screenshot_manager:
             screenshot_name = f"{step.value.lower()}_failed"
@@ -151,7 +167,7 @@ class StepExecutionTemplate:
                              description: str, exception: Exception) -> ProcessResult:
         """Manejo común de excepción en paso"""
         error_msg = f"Error inesperado en {description}: {exception}"
-        self.logger.error(error_msg, module=SystemModule.FDA.value, exception=exception)
+        self.logger.error(error_msg, module=_FDA_MODULE, exception=exception)
         
         if self.screenshot_manager:
             screenshot_name = f"{step.value.lower()}_error"
@@ -166,7 +182,7 @@ class StepExecutionTemplate:
     
     def _pause_between_steps(self):
         """Pausa estándar entre pasos - elimina duplicación"""
-        self.logger.debug(f"⏸️ Pausa entre pasos ({SleepTimes.BETWEEN_STEPS}s)", module=SystemModule.FDA.value)
+        self.logger.debug(f"⏸️ Pausa entre pasos ({SleepTimes.BETWEEN_STEPS}s)", module=_FDA_MODULE)
         print(f"⏸️ Pausa entre pasos...")
         time.sleep(SleepTimes.BETWEEN_STEPS)
 
@@ -188,16 +204,7 @@ class CommonValidators:
                                by_method='css') -> bool:
         """Valida que un elemento esté presente"""
         try:
-            from selenium.webdriver.common.by import By
-            
-            by_map = {
-                'css': By.CSS_SELECTOR,
-                'xpath': By.XPATH,
-                'id': By.ID,
-                'class': By.CLASS_NAME
-            }
-            
-            driver.find_element(by_map.get(by_method, By.CSS_SELECTOR), selector)
+            driver.find_element(_BY_METHODS.get(by_method, By.CSS_SELECTOR), selector)
             return True
         except:
             return False
@@ -206,7 +213,6 @@ class CommonValidators:
     def validate_file_exists(file_path) -> bool:
         """Valida que un archivo exista"""
         try:
-            from pathlib import Path
             return Path(file_path).exists()
         except:
             return False
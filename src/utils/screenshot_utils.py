@@ -5,6 +5,8 @@ Incluye optimizaciones: compresión, captura asíncrona, limpieza automática
 """
 
 import os
+import heapq
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Union
@@ -22,7 +24,11 @@ class OptimizedScreenshotManager:
     Manejador optimizado de screenshots con compresión y limpieza automática
     """
     
-    def __init__(self, logger=None, max_screenshots: int = 100, compress_images: bool = True):
+    # Modos de captura: todo, solo errores, o nada
+    CAPTURE_MODES = ("all", "errors_only", "off")
+    
+    def __init__(self, logger=None, max_screenshots: int = 100, compress_images: bool = True,
+                 capture_mode: str = "all"):
         """
         Inicializa el manejador optimizado de screenshots
         
@@ -30,11 +36,16 @@ class OptimizedScreenshotManager:
             logger: Instancia del AutomationLogger (deprecated)
             max_screenshots: Máximo número de screenshots por día
             compress_images: Si comprimir las imágenes para ahorrar espacio
+            capture_mode: "all", "errors_only" u "off"
         """
+        if capture_mode not in self.CAPTURE_MODES:
+            raise ValueError(f"capture_mode inválido: {capture_mode} (opciones: {self.CAPTURE_MODES})")
+        
         self.logger = AutomationLogger.get_instance()
         self.screenshots_dir = Path("logs/screenshots")
         self.max_screenshots = max_screenshots
         self.compress_images = compress_images
+        self.capture_mode = capture_mode
         self._screenshot_count = 0
         self._executor = ThreadPoolExecutor(max_workers=2)
         self._ensure_screenshot_directory()
@@ -48,6 +59,12 @@ class OptimizedScreenshotManager:
         # Limpieza automática en background
         self._auto_cleanup()
     
+    def should_capture(self, kind: str) -> bool:
+        """Indica si un screenshot del tipo dado ('step', 'success', 'error') debe capturarse"""
+        if self.capture_mode == "all":
+            return True
+        return self.capture_mode == "errors_only" and kind == "error"
+    
     def _ensure_screenshot_directory(self):
         """Crea el directorio de screenshots si no existe"""
         today = datetime.now().strftime('%Y-%m-%d')
@@ -117,6 +134,14 @@ class OptimizedScreenshotManager:
             })
             return False
     
+    def build_screenshot_path(self, context: str, level: str = "INFO") -> Path:
+        """Ruta única (con milisegundos) para un screenshot PNG en el directorio del día"""
+        now = time.time()
+        timestamp = f"{time.strftime('%H%M%S', time.localtime(now))}_{int(now * 1000) % 1000:03d}"  # milisegundos
+        clean_context = "".join(c for c in context if c.isalnum() or c in (' ', '-', '_')).strip()
+        clean_context = clean_context.replace(' ', '_')
+        return self.daily_dir / f"{level.lower()}_{clean_context}_{timestamp}.png"
+    
     def capture_screenshot_async(self, 
                                 driver: webdriver.Chrome, 
                                 context: str = "screenshot",
@@ -134,12 +159,8 @@ class OptimizedScreenshotManager:
         
         try:
             # Generar nombre único del archivo
-            timestamp = datetime.now().strftime('%H%M%S_%f')[:-3]  # milisegundos
-            clean_context = "".join(c for c in context if c.isalnum() or c in (' ', '-', '_')).strip()
-            clean_context = clean_context.replace(' ', '_')
-            
-            filename = f"{level.lower()}_{clean_context}_{timestamp}.png"
-            filepath = self.daily_dir / filename
+            filepath = self.build_screenshot_path(context, level)
+            filename = filepath.name
             
             # Capturar screenshot (rápido)
             screenshot_data = driver.get_screenshot_as_png()
@@ -209,7 +230,7 @@ class OptimizedScreenshotManager:
         
         try:
             # Generar nombre único del archivo
-            timestamp = datetime.now().strftime('%H%M%S')
+            timestamp = time.strftime('%H%M%S')
             clean_context = "".join(c for c in context if c.isalnum() or c in (' ', '-', '_')).strip()
             clean_context = clean_context.replace(' ', '_')
             
@@ -335,6 +356,7 @@ class OptimizedScreenshotManager:
                                step_number: Optional[int] = None) -> Optional[str]:
         """
         Captura un screenshot para documentar un paso del proceso
+        (la escritura a disco y la compresión se hacen en background)
         
         Args:
             driver: Instancia del WebDriver
@@ -352,13 +374,14 @@ class OptimizedScreenshotManager:
             "step_context": step_context
         })
         
-        return self.capture_screenshot(driver, step_context, "INFO")
+        return self.capture_screenshot_async(driver, step_context, "INFO")
     
     def capture_success_screenshot(self, 
                                   driver: webdriver.Chrome, 
                                   success_context: str) -> Optional[str]:
         """
         Captura un screenshot para documentar un éxito/completación
+        (la escritura a disco y la compresión se hacen en background)
         
         Args:
             driver: Instancia del WebDriver
@@ -371,7 +394,7 @@ class OptimizedScreenshotManager:
             "success_context": success_context
         })
         
-        return self.capture_screenshot(driver, f"success_{success_context}", "INFO")
+        return self.capture_screenshot_async(driver, f"success_{success_context}", "INFO")
     
     def get_screenshot_summary(self) -> dict:
         """
@@ -400,7 +423,9 @@ class OptimizedScreenshotManager:
                 'total_screenshots': len(screenshots),
                 'by_type': by_type,
                 'screenshots_directory': str(self.daily_dir),
-                'latest_screenshots': [s.name for s in sorted(screenshots, key=lambda x: x.stat().st_mtime)[-5:]]
+                'latest_screenshots': [
+                    s.name for s in reversed(heapq.nlargest(5, screenshots, key=lambda x: x.stat().st_mtime))
+                ]
             }
             
             self.logger.selenium_logger.info("Resumen de screenshots generado", extra=summary)
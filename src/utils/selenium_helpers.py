@@ -39,10 +39,11 @@ class ElementCache:
     
     def get_selector(self, key: str) -> Optional[str]:
         """Obtiene un selector del caché"""
-        if key in self._cache:
+        selector = self._cache.get(key)
+        if selector is not None:
             self._stats["hits"] += 1
             logger.selenium_logger.debug("Cache hit", extra={"key": key})
-            return self._cache[key]
+            return selector
         self._stats["misses"] += 1
         return None
     
@@ -55,13 +56,12 @@ class ElementCache:
         })
     
     def get_stats(self) -> Dict:
-        """Obtiene estadísticas del caché"""
+        """Obtiene estadísticas del caché (hit_rate_pct numérico, se formatea al mostrar)"""
         total = self._stats["hits"] + self._stats["misses"]
-        hit_rate = (self._stats["hits"] / total * 100) if total > 0 else 0
         return {
             **self._stats,
             "total": total,
-            "hit_rate": f"{hit_rate:.1f}%"
+            "hit_rate_pct": (self._stats["hits"] / total * 100) if total > 0 else 0.0
         }
     
     def clear_cache(self):
@@ -69,6 +69,9 @@ class ElementCache:
         self._cache.clear()
         self._stats = {"hits": 0, "misses": 0}
 
+# Instancia compartida del singleton, resuelta una vez al importar el módulo
+_element_cache = ElementCache()
+
 class OptimizedWaitHelper:
     """
     Helper optimizado para waits más eficientes
@@ -82,7 +85,7 @@ class OptimizedWaitHelper:
         if timeout is None:
             timeout = ElementTimeouts.DEFAULT
             
-        cache = ElementCache()
+        cache = _element_cache
         
         # Buscar en caché primero
         for i, selector in enumerate(selectors):
@@ -179,7 +182,7 @@ class ElementFinder:
         
         print(LogMessages.SEARCHING_ELEMENT.format(element=element_name))
         
-        cache = ElementCache()
+        cache = _element_cache
         
         # 1. Buscar en caché primero (más rápido)
         cache_key = f"element_{element_name}_{hash(tuple(selectors))}"
@@ -567,20 +570,22 @@ class WaitHelper:
     """Clase para manejar esperas inteligentes"""
     
     @staticmethod
-    def wait_for_page_load(driver, timeout: int = ElementTimeouts.NAVIGATION):
+    def wait_for_page_load(driver, timeout: int = ElementTimeouts.NAVIGATION, dom_ready: bool = False):
         """
         Espera a que la página se cargue completamente
         
         Args:
             driver: WebDriver instance
             timeout: Timeout en segundos
+            dom_ready: Si basta con el DOM listo (readyState 'interactive'), sin esperar subrecursos
         """
         logger.selenium_logger.debug("Esperando carga completa de página", extra={
             "timeout": timeout
         })
         
+        ready_states = ("interactive", "complete") if dom_ready else ("complete",)
         wait = WebDriverWait(driver, timeout)
-        wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        wait.until(lambda driver: driver.execute_script("return document.readyState") in ready_states)
         
         logger.selenium_logger.info("Página cargada completamente")
 